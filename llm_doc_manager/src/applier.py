@@ -19,16 +19,25 @@ Line Number Convention:
     All lines arrays use INTERNAL (0-indexed) access.
 """
 
+import errno
+import hashlib
+import itertools
+import os
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import groupby
 from pathlib import Path
 from typing import List, Optional, Dict, Union
 from dataclasses import dataclass
 
 from .config import Config
-from .queue import DocTask, QueueManager
+from .queue import QueueManager
 from ..utils.docstring_handler import find_docstring_location
 from ..utils.logger_setup import get_logger
+from ..utils.marker_detector import MarkerPatterns, MarkerType
 from ..utils.response_schemas import (
     ModuleDocstring,
     ClassDocstring,
@@ -57,13 +66,7 @@ def extract_indentation(line: str) -> str:
     Returns:
         String containing leading whitespace (spaces/tabs)
     """
-    indent = ""
-    for char in line:
-        if char in [' ', '\t']:
-            indent += char
-        else:
-            break
-    return indent
+    return line[:len(line) - len(line.lstrip(' \t'))]
 
 
 def add_indent_level(base_indent: str) -> str:
@@ -93,6 +96,59 @@ def add_indent_level(base_indent: str) -> str:
         return base_indent + '    '  # Default 4 spaces
 
 
+DEFINITION_PREFIXES = ('def ', 'async def ', 'class ')
+
+
+def find_definition_line(lines: List[str], marker_line_idx: int) -> int:
+    """
+    Find the function/class definition that follows a start marker.
+
+    Searches forward until a definition is found, another marker is hit,
+    or the file ends (no arbitrary limit).
+
+    Args:
+        lines: File lines (0-indexed array)
+        marker_line_idx: INTERNAL (0-indexed) index of the start marker
+
+    Returns:
+        INTERNAL (0-indexed) index of the definition line, or the line
+        right after the marker if none was found
+    """
+    for i in range(marker_line_idx + 1, len(lines)):
+        line = lines[i].lstrip()
+
+        # Stop if we hit another marker (means we're past the block)
+        if line.startswith('# @llm-'):
+            break
+
+        # Check for function/class definition
+        if line.startswith(DEFINITION_PREFIXES):
+            return i
+
+    # Fallback: assume definition is right after marker
+    return marker_line_idx + 1
+
+
+# os.link failures that mean "no hardlink here" and justify copying instead
+LINK_FALLBACK_ERRNOS = frozenset(
+    (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP)
+)
+
+
+# How each task type is applied: Applier method and its extra arguments
+# (the marker prefix for docstrings)
+TASK_APPLIERS = {
+    "generate_module": ("_replace_docstring", ("@llm-module",)),
+    "validate_module": ("_replace_docstring", ("@llm-module",)),
+    "generate_docstring": ("_replace_docstring", ("@llm-doc",)),
+    "validate_docstring": ("_replace_docstring", ("@llm-doc",)),
+    "generate_class": ("_replace_docstring", ("@llm-class",)),
+    "validate_class": ("_replace_docstring", ("@llm-class",)),
+    "generate_comment": ("_replace_comment", ()),
+    "validate_comment": ("_replace_comment", ()),
+}
+
+
 @dataclass
 class Suggestion:
     """Represents a documentation suggestion."""
@@ -119,124 +175,277 @@ class Applier:
         self.config = config
         self.queue_manager = queue_manager
         self.backup_dir = Path(config.output.backup_dir)
-        self.backed_up_files = set()  # Track files that have been backed up
+        self.backed_up_files = set()  # (st_dev, st_ino) of files already backed up
+        self._backup_lock = threading.Lock()  # apply_suggestions runs files in threads
+
+        # Use centralized pre-compiled patterns (compiled once, not per file)
+        compiled = MarkerPatterns.get_compiled_patterns()
+        self.module_start_pattern = compiled[MarkerType.MODULE_DOC]['start']
+        self.comment_end_pattern = compiled[MarkerType.COMMENT]['end']
 
     def apply_suggestion(self, suggestion: Suggestion) -> bool:
         """
         Apply a single suggestion to a file.
 
+        Delegates to the batched path so the file is split and joined
+        exactly once, same as when many suggestions target it.
+
         Args:
             suggestion: Suggestion to apply
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            file_path = Path(suggestion.file_path)
+        self.apply_suggestions([suggestion])
+        return suggestion.applied
 
-            # Create backup if enabled (only once per file)
-            if self.config.output.backup:
-                file_key = str(file_path.resolve())
-                if file_key not in self.backed_up_files:
-                    self._create_backup(file_path)
-                    self.backed_up_files.add(file_key)
+    def apply_suggestions(self, suggestions: List[Suggestion]) -> Dict[str, str]:
+        """
+        Apply many suggestions with a single read/write per file.
+
+        Suggestions are grouped by file and applied bottom-up (descending
+        line number) on one in-memory lines list, so earlier edits never
+        shift the markers of edits still pending. Different files are
+        processed concurrently, bounded by ``output.max_concurrent_io``.
+        Each suggestion's ``applied`` flag reports its individual outcome.
+
+        Args:
+            suggestions: Suggestions to apply (any order, any files)
+
+        Returns:
+            Mapping of file path to the content written, for files that
+            actually changed
+        """
+        # One backup timestamp for the whole session
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Group by the real file so different spellings of one path (relative,
+        # absolute, symlink) are edited together instead of racing each other
+        real_paths = {s.file_path: os.path.realpath(s.file_path) for s in suggestions}
+        ordered = sorted(suggestions, key=lambda s: real_paths[s.file_path])
+        groups = [list(group)
+                  for _, group in groupby(ordered, key=lambda s: real_paths[s.file_path])]
+
+        # Files are independent - overlap their read/backup/write syscalls
+        max_workers = max(1, min(self.config.output.max_concurrent_io, len(groups)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            contents = executor.map(
+                lambda group: self._apply_file(Path(group[0].file_path), group, timestamp),
+                groups
+            )
+            written = {
+                group[0].file_path: content
+                for group, content in zip(groups, contents)
+                if content is not None
+            }
+
+        return written
+
+    def _apply_file(self, file_path: Path, suggestions: List[Suggestion],
+                    timestamp: str) -> Optional[str]:
+        """
+        Apply all suggestions targeting one file.
 
-            # Read file content
+        Args:
+            file_path: File to modify
+            suggestions: Suggestions for this file
+            timestamp: Backup timestamp shared by the apply session
+
+        Returns:
+            New file content if the file was rewritten, None otherwise
+        """
+        try:
+            stat_result = os.stat(file_path)
+        except OSError as e:
+            logger.error(f"Error reading {file_path}: {e}")
+            return None
+
+        try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+                # Line ending seen while decoding ('\r\n', '\n', ...); None if mixed/none
+                newline = f.newlines if isinstance(f.newlines, str) else None
+        except Exception as e:
+            logger.error(f"Error reading {file_path}: {e}")
+            return None
 
-            # Apply the change
-            modified_content = self._apply_change(
-                content,
-                suggestion.line_number,
-                suggestion.original_text,
-                suggestion.suggested_text,
-                suggestion.task_type
-            )
+        lines = content.split('\n')
+        applied = []
+
+        # Bottom-up so line numbers of pending suggestions stay valid
+        for suggestion in sorted(suggestions, key=lambda s: s.line_number, reverse=True):
+            try:
+                self._apply_change(
+                    lines,
+                    suggestion.line_number,
+                    suggestion.original_text,
+                    suggestion.suggested_text,
+                    suggestion.task_type
+                )
+                applied.append(suggestion)
+            except Exception as e:
+                logger.error(f"Error applying suggestion at {file_path}:{suggestion.line_number}: {e}")
+
+        if not applied:
+            return None
+
+        modified_content = '\n'.join(lines)
+
+        if modified_content == content:
+            # Nothing changed (e.g. suggestion already present) - skip backup and write
+            for suggestion in applied:
+                suggestion.applied = True
+            return None
 
-            # Write back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
+        try:
+            # Create backup if enabled (only once per file)
+            # Keyed by inode: one stat, no path resolution, hardlinks dedup
+            inode = (stat_result.st_dev, stat_result.st_ino)
+            with self._backup_lock:
+                backed_up = inode in self.backed_up_files
+                if self.config.output.backup and not backed_up:
+                    self._create_backup(file_path, timestamp)
+                    self.backed_up_files.add(inode)
+                    backed_up = True
+
+            self._write_file(file_path, modified_content, newline)
+        except Exception as e:
+            logger.error(f"Error writing {file_path}: {e}")
+            return None
 
+        for suggestion in applied:
             suggestion.applied = True
-            return True
 
-        except Exception as e:
-            logger.error(f"Error applying suggestion: {e}")
-            return False
+        try:
+            new_stat = os.stat(file_path)
+            # The atomic write created a new inode - it is covered by the same backup
+            if backed_up:
+                with self._backup_lock:
+                    self.backed_up_files.add((new_stat.st_dev, new_stat.st_ino))
+        except OSError:
+            pass  # Bookkeeping only
+
+        return modified_content
 
-    def _create_backup(self, file_path: Path):
+    def _create_backup(self, file_path: Path, timestamp: str) -> Path:
         """
         Create backup of file before modification.
 
+        The backup is a hardlink to the current file when the filesystem
+        allows it (no data copied); _write_file always writes a new inode,
+        so the backup keeps the original content. Falls back to a copy when
+        hardlinks are not possible. An existing backup is never overwritten:
+        a taken name gets a "-<n>" counter instead.
+
         Args:
             file_path: Path to file to backup
+            timestamp: Session timestamp used in the backup filename
+
+        Returns:
+            Path of the backup created
         """
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create backup filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{file_path.name}.{timestamp}.bak"
-        backup_path = self.backup_dir / backup_name
+        # Create backup filename with path tag and timestamp
+        stem = f"{self._backup_prefix(file_path)}{timestamp}"
+
+        for attempt in itertools.count():
+            counter = f"-{attempt}" if attempt else ""
+            backup_path = self.backup_dir / f"{stem}{counter}.bak"
+
+            try:
+                os.link(file_path, backup_path)
+                return backup_path
+            except FileExistsError:
+                continue  # Name taken - never write through another backup
+            except OSError as e:
+                if e.errno not in LINK_FALLBACK_ERRNOS:
+                    raise
+
+            # Hardlink not possible here - copy, still refusing existing names
+            try:
+                with open(file_path, 'rb') as src, open(backup_path, 'xb') as dst:
+                    shutil.copyfileobj(src, dst)
+            except FileExistsError:
+                continue
+            shutil.copystat(file_path, backup_path)
+            return backup_path
 
-        # Copy file
-        shutil.copy2(file_path, backup_path)
+    @staticmethod
+    def _backup_prefix(file_path: Path) -> str:
+        """
+        Backup filename prefix for a file: "<name>.<path tag>.".
 
-    def _apply_change(self, content: str, line_number: int,
+        The tag is a short hash of the file's real path, so files sharing a
+        name in different directories (e.g. __init__.py) never share backups.
+        """
+        real_path = os.path.realpath(file_path)
+        tag = hashlib.sha256(real_path.encode('utf-8', 'surrogateescape')).hexdigest()[:12]
+        return f"{Path(real_path).name}.{tag}."
+
+    def _write_file(self, file_path: Path, content: str,
+                    newline: Optional[str] = None):
+        """
+        Replace file content atomically.
+
+        Writes to a temporary file in the same directory and renames it
+        over the target, which also breaks any hardlink held by a backup.
+
+        Args:
+            file_path: File to overwrite (symlinks are followed)
+            content: New file content ('\n' line endings)
+            newline: Line ending to write (keeps the file's original style);
+                None writes '\n'
+        """
+        target = Path(os.path.realpath(file_path))
+        fd, tmp_path = tempfile.mkstemp(
+            dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline=newline or '\n') as f:
+                f.write(content)
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _apply_change(self, lines: List[str], line_number: int,
                      original_text: str, suggested_text: str,
-                     task_type: str) -> str:
+                     task_type: str):
         """
-        Apply change to file content.
+        Apply change to file lines in place.
 
         Args:
-            content: Original file content
+            lines: File lines (0-indexed array), modified in place
             line_number: EXTERNAL (1-indexed) line number where marker is
             original_text: Original text (for verification)
             suggested_text: New text to insert
             task_type: Type of task (determines how to apply)
-
-        Returns:
-            Modified content
         """
-        lines = content.split('\n')
-
-        if task_type in ["generate_module", "validate_module"]:
-            # Replace or insert module docstring
-            return self._replace_docstring(lines, line_number, original_text, suggested_text, '@llm-module')
-
-        elif task_type in ["generate_docstring", "validate_docstring"]:
-            # Replace or insert docstring
-            return self._replace_docstring(lines, line_number, original_text, suggested_text, '@llm-doc')
-
-        elif task_type in ["generate_class", "validate_class"]:
-            # Replace or insert class docstring
-            return self._replace_docstring(lines, line_number, original_text, suggested_text, '@llm-class')
-
-        elif task_type in ["generate_comment", "validate_comment"]:
-            # Replace or insert inline comment
-            return self._replace_comment(lines, line_number, original_text, suggested_text)
-
-        else:
+        entry = TASK_APPLIERS.get(task_type)
+        if entry is None:
             # Unsupported task type
             logger.warning(f"Unsupported task type '{task_type}' - skipping application")
-            return content
+            return
+
+        method_name, extra_args = entry
+        getattr(self, method_name)(lines, line_number, original_text, suggested_text, *extra_args)
 
     def _replace_docstring(self, lines: List[str], line_number: int,
                           original_text: str, suggested_text: Union[ModuleDocstring, ClassDocstring, MethodDocstring, str],
-                          marker_prefix: str) -> str:
+                          marker_prefix: str):
         """
-        Replace or insert a docstring.
+        Replace or insert a docstring in place.
 
         Args:
-            lines: File lines (0-indexed array)
+            lines: File lines (0-indexed array), modified in place
             line_number: EXTERNAL (1-indexed) line number where marker start is
             original_text: Original docstring (if any)
             suggested_text: Pydantic schema object or formatted string (for validate_* tasks)
             marker_prefix: Marker prefix (@llm-doc, @llm-class, or @llm-module)
 
-        Returns:
-            Modified content
-
         Raises:
             ValueError: If line_number is outside valid range
         """
@@ -251,31 +460,14 @@ class Applier:
         if marker_prefix == '@llm-module':
             marker_line_idx = line_number - 1
             marker_indent = extract_indentation(lines[marker_line_idx])
-            return self._replace_module_docstring(lines, suggested_text, marker_indent)
+            self._replace_module_docstring(lines, suggested_text, marker_indent)
+            return
 
         # Convert EXTERNAL (1-indexed) to INTERNAL (0-indexed)
         # line_number points to marker start (e.g., line 10 in editor = index 9)
         # Definition should be on the NEXT line after the marker
         marker_line_idx = line_number - 1  # INTERNAL: Convert to 0-indexed
-        func_line_idx = None
-
-        # Search FORWARD from marker to find the function/class definition
-        # Search until we find definition or reach end of file (no arbitrary limit)
-        for i in range(marker_line_idx + 1, len(lines)):
-            line = lines[i].strip()
-
-            # Stop if we hit another marker (means we're past the block)
-            if line.startswith('# @llm-'):
-                break
-
-            # Check for function/class definition
-            if line.startswith('def ') or line.startswith('async def ') or line.startswith('class '):
-                func_line_idx = i
-                break
-
-        if func_line_idx is None:
-            # Fallback: assume function is right after marker
-            func_line_idx = marker_line_idx + 1
+        func_line_idx = find_definition_line(lines, marker_line_idx)
 
         # Use centralized utility to find existing docstring
         search_start = func_line_idx + 1
@@ -314,22 +506,17 @@ class Applier:
         # NOTE: Markers are preserved in the code for hash-based tracking.
         # They will NOT be removed after documentation is applied.
 
-        return '\n'.join(lines)
-
     def _replace_comment(self, lines: List[str], line_number: int,
-                        original_text: str, suggested_text: str) -> str:
+                        original_text: str, suggested_text: str):
         """
-        Replace or insert an inline comment.
+        Replace or insert an inline comment in place.
 
         Args:
-            lines: File lines (0-indexed array)
+            lines: File lines (0-indexed array), modified in place
             line_number: EXTERNAL (1-indexed) line number where @llm-comm-start marker is
             original_text: Original comment (if any)
             suggested_text: New comment text
 
-        Returns:
-            Modified content
-
         Raises:
             ValueError: If line_number is outside valid range
         """
@@ -352,7 +539,7 @@ class Applier:
             line = lines[i].strip()
 
             # Stop if we hit the end marker
-            if line.startswith('# @llm-comm-end'):
+            if self.comment_end_pattern.match(line):
                 break
 
             # Skip empty lines
@@ -394,43 +581,33 @@ class Applier:
                 else:
                     break
 
-            # Remove old comment lines (inclusive range)
-            del lines[existing_comment_idx:comment_end_idx + 1]
-
-            # Insert new comment lines at the same position
-            for j, formatted_line in enumerate(formatted_lines):
-                lines.insert(existing_comment_idx + j, formatted_line)
+            # Swap old comment lines (inclusive range) for the new ones in one splice
+            lines[existing_comment_idx:comment_end_idx + 1] = formatted_lines
         else:
             # INSERT MODE: Insert new comment above the code line
-            for j, formatted_line in enumerate(formatted_lines):
-                lines.insert(code_line_idx + j, formatted_line)
+            lines[code_line_idx:code_line_idx] = formatted_lines
 
         # NOTE: Markers are preserved in the code for hash-based tracking.
         # They will NOT be removed after documentation is applied.
 
-        return '\n'.join(lines)
-
     def _replace_module_docstring(self, lines: List[str],
                                  suggested_text: Union[ModuleDocstring, str],
-                                 marker_indent: str = "") -> str:
+                                 marker_indent: str = ""):
         """
-        Replace or insert module-level docstring at the top of the file.
+        Replace or insert module-level docstring at the top of the file in place.
 
         Module docstrings appear at the very beginning of the file,
         before any imports or code, but after the @llm-module-start marker.
 
         Args:
-            lines: File lines (0-indexed array)
+            lines: File lines (0-indexed array), modified in place
             suggested_text: Pydantic schema object or formatted string (for validate_* tasks)
             marker_indent: Indentation from marker line (usually no indentation)
-
-        Returns:
-            Modified content
         """
         # Find the @llm-module-start marker (should be line 0)
         marker_start_idx = None
         for i, line in enumerate(lines):
-            if line.strip().startswith('# @llm-module-start'):
+            if self.module_start_pattern.match(line):
                 marker_start_idx = i
                 break
 
@@ -454,7 +631,7 @@ class Applier:
             if not line:
                 continue
             # Check if this line starts a docstring
-            if line.startswith('"""') or line.startswith("'''"):
+            if line.startswith(('"""', "'''")):
                 # Found start of docstring - use helper to find the end
                 ds_start, ds_end = find_docstring_location(lines, i)
                 if ds_start is not None:
@@ -486,8 +663,6 @@ class Applier:
             docstring_lines = formatted_docstring.split('\n')
             lines[insert_at:insert_at] = docstring_lines
 
-        return '\n'.join(lines)
-
     def rollback(self, file_path: str) -> bool:
         """
         Rollback to most recent backup of a file.
@@ -505,20 +680,25 @@ class Applier:
         """
         try:
             file_path = Path(file_path)
-            file_name = file_path.name
 
-            # Find most recent backup
-            backups = sorted(
-                self.backup_dir.glob(f"{file_name}.*.bak"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True
-            )
+            # Find most recent backup ("<name>.<path tag>.<timestamp>[-<n>].bak")
+            # scandir stats each entry once; max() avoids a full sort
+            prefix = self._backup_prefix(file_path)
+            backups = []
+            if self.backup_dir.is_dir():
+                with os.scandir(self.backup_dir) as entries:
+                    backups = [
+                        (entry.stat().st_mtime, entry.name)
+                        for entry in entries
+                        if entry.name.startswith(prefix)
+                        and entry.name[len(prefix):].endswith('.bak')
+                    ]
 
             if not backups:
                 logger.warning(f"No backups found for {file_path}")
                 return False
 
-            most_recent = backups[0]
+            most_recent = self.backup_dir / max(backups)[1]
 
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -533,10 +713,11 @@ class Applier:
 
             # Restore backup - read from backup and write to destination
             # This is more robust than shutil.copy2 for corrupted files
-            with open(most_recent, 'r', encoding='utf-8') as f:
+            # newline='' restores line endings byte-for-byte
+            with open(most_recent, 'r', encoding='utf-8', newline='') as f:
                 content = f.read()
 
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(file_path, 'w', encoding='utf-8', newline='') as f:
                 f.write(content)
 
             logger.info(f"Restored from backup: {most_recent.name}")
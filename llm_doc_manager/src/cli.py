@@ -11,26 +11,14 @@ import traceback
 from pathlib import Path
 from typing import Optional
 
+# Only lightweight imports at module level: the heavy components (LLM SDKs,
+# pydantic schemas, SQLite, scanners) are imported inside the commands that
+# use them, keeping --help, --version and shell completion fast.
 from .config import Config, ConfigManager, LLMConfig
-from .queue import QueueManager, TaskStatus
-from .scanner import Scanner
-from .processor import Processor, ProcessResult
-from .applier import Applier, Suggestion
-from .hashing import HashStorage
-from .detector import ChangeDetector
-from .generator import DocsGenerator
-from .constants import TASK_TYPE_LABELS
-from .database import DatabaseManager
-from ..utils.marker_validator import MarkerValidator, ValidationLevel
-from ..utils.llm_client import LLMClientFactory
 from ..utils.logger_setup import LoggerManager
-from ..utils.response_schemas import (
-    ModuleDocstring,
-    ClassDocstring,
-    MethodDocstring,
-    ValidationResult
-)
-from ..utils.review_formatter import format_task_for_review
+
+# Upper bound on progress bar redraws per 'process' run
+PROGRESS_REDRAWS = 100
 
 
 def _get_hierarchical_blocks(changed_names: set, blocks: list) -> list:
@@ -113,10 +101,22 @@ def init(overwrite):
 @cli.command()
 @click.option('--path', multiple=True, help='Paths to scan (can specify multiple)')
 @click.option('--force', is_flag=True, help='Force rescan even if files are unchanged')
-def sync(path, force):
+@click.option('--max-file-size-mb', type=float,
+              help='Skip files larger than this (default: scanning.max_file_size_mb)')
+def sync(path, force, max_file_size_mb):
     """Sync markers with hash-based change detection and create tasks."""
 
     try:
+        from .queue import QueueManager
+        from .scanner import Scanner
+        from .processor import Processor
+        from .hashing import HashStorage
+        from .detector import ChangeDetector
+        from .generator import DocsGenerator
+        from .database import DatabaseManager
+        from ..utils.marker_validator import MarkerValidator, ValidationLevel
+        from ..utils.llm_client import LLMClientFactory
+
         # Load config
         config_manager = ConfigManager()
         config = config_manager.load()
@@ -124,6 +124,8 @@ def sync(path, force):
         # Override config with command-line options
         if path:
             config.scanning.paths = list(path)
+        if max_file_size_mb is not None:
+            config.scanning.max_file_size_mb = max_file_size_mb
 
         # Initialize components
         queue_manager = QueueManager()
@@ -321,7 +323,9 @@ def sync(path, force):
                         api_key=api_key_docs,
                         base_url=config_docs.llm.base_url,
                         temperature=config_docs.llm.temperature,
-                        max_tokens=config_docs.llm.max_tokens
+                        max_tokens=config_docs.llm.max_tokens,
+                        timeout=config_docs.llm.timeout,
+                        max_retries=config_docs.llm.max_retries
                     )
 
                     docs_generator = DocsGenerator(
@@ -397,9 +401,16 @@ def sync(path, force):
 @cli.command()
 @click.option('--limit', type=int, help='Maximum number of tasks to process')
 @click.option('--debug', is_flag=True, help='Print prompts before sending to LLM')
-def process(limit, debug):
+@click.option('--batch-size', type=int, default=1, show_default=True,
+              help='Tasks of the same type sent per LLM request (OpenAI; 8-16 recommended)')
+@click.option('--batch', 'use_batch_api', is_flag=True,
+              help='Submit tasks as an offline OpenAI/Anthropic batch job (cheaper, results within 24h)')
+def process(limit, debug, batch_size, use_batch_api):
     """Process pending documentation tasks with LLM."""
     try:
+        from .queue import QueueManager
+        from .processor import Processor
+
         # Load config
         config_manager = ConfigManager()
         config = config_manager.load()
@@ -420,13 +431,27 @@ def process(limit, debug):
         if debug:
             processor.debug = True
 
-        # Get pending tasks
-        pending = queue_manager.get_pending_tasks(limit=limit)
+        # Claim pending tasks (marked PROCESSING atomically) so overlapping
+        # runs never dispatch - and bill - the same task twice
+        pending = queue_manager.claim_pending_tasks(limit=limit)
 
         if not pending:
             click.echo("No pending tasks found. Run 'llm-doc-manager sync' first.")
             return
 
+        claimed_ids = [task.id for task in pending]
+
+        if use_batch_api:
+            try:
+                batch_id = processor.submit_batch_job(pending)
+            except BaseException:
+                # Submission failed - nothing was dispatched, give the tasks back
+                queue_manager.release_tasks(claimed_ids)
+                raise
+            click.echo(f"📦 Submitted {len(pending)} task(s) in batch job {batch_id}")
+            click.echo("\nNext: Run 'llm-doc-manager poll-batch' to collect the results")
+            return
+
         click.echo(f"🤖 Processing {len(pending)} task(s)...\n")
 
         # Process tasks
@@ -434,15 +459,32 @@ def process(limit, debug):
         successful = 0
         failed = 0
 
-        with click.progressbar(pending, label='Processing tasks') as tasks:
-            for task in tasks:
-                result = processor.process_task(task)
-
-                if result.success:
-                    successful += 1
-                    total_tokens += result.tokens_used
-                else:
-                    failed += 1
+        batches = processor.make_batches(pending, batch_size)
+
+        # Redraw the bar at most PROGRESS_REDRAWS times, not once per task
+        min_steps = max(1, len(pending) // PROGRESS_REDRAWS)
+
+        try:
+            # Results are committed to the queue in bulk, not once per task
+            with processor.batched_writes(), \
+                    click.progressbar(length=len(pending), label='Processing tasks',
+                                      update_min_steps=min_steps) as bar:
+                for batch, results in processor.process_batches_concurrently(batches):
+                    for result in results:
+                        if result.success:
+                            successful += 1
+                            total_tokens += result.tokens_used
+                        else:
+                            failed += 1
+
+                    bar.update(len(batch))
+
+                # Draw the steps still below the redraw threshold
+                bar.update_min_steps = 1
+                bar.update(0)
+        finally:
+            # Tasks left without an outcome (interrupted run) go back to PENDING
+            queue_manager.release_tasks(claimed_ids)
 
         # Display summary
         click.echo(f"\n✓ Processing complete!")
@@ -460,11 +502,63 @@ def process(limit, debug):
         sys.exit(1)
 
 
+@cli.command('poll-batch')
+@click.option('--batch-id', help='Batch job to collect (default: all open jobs)')
+def poll_batch(batch_id):
+    """Collect results of batch jobs submitted with 'process --batch'."""
+    try:
+        from .queue import QueueManager
+        from .processor import Processor
+
+        config_manager = ConfigManager()
+        config = config_manager.load()
+
+        queue_manager = QueueManager()
+        processor = Processor(config, queue_manager)
+
+        batch_ids = [batch_id] if batch_id else queue_manager.get_open_batch_ids()
+        if not batch_ids:
+            click.echo("No open batch jobs found.")
+            return
+
+        successful = 0
+        failed = 0
+        total_tokens = 0
+
+        for current_id in batch_ids:
+            results = processor.collect_batch_job(current_id)
+            if results is None:
+                click.echo(f"⏳ {current_id}: still running")
+                continue
+
+            click.echo(f"✓ {current_id}: {len(results)} result(s) collected")
+            for result in results:
+                if result.success:
+                    successful += 1
+                    total_tokens += result.tokens_used
+                else:
+                    failed += 1
+
+        if successful or failed:
+            click.echo(f"\n  Successful: {successful}")
+            click.echo(f"  Failed: {failed}")
+            click.echo(f"  Total tokens used: {total_tokens:,}")
+
+        if successful > 0:
+            click.echo("\nNext: Run 'llm-doc-manager review' to review suggestions")
+
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.option('--task-id', type=int, help='Retry specific task by ID')
 def retry(task_id):
     """Retry failed documentation tasks."""
     try:
+        from .queue import QueueManager, TaskStatus
+
         queue_manager = QueueManager()
 
         # Get failed tasks
@@ -554,6 +648,10 @@ def _sort_tasks_hierarchically(tasks):
 def review():
     """Review and accept/reject suggestions interactively."""
     try:
+        from .queue import QueueManager, TaskStatus
+        from .constants import TASK_TYPE_LABELS
+        from ..utils.review_formatter import format_task_for_review
+
         # Load config
         config_manager = ConfigManager()
         config = config_manager.load()
@@ -639,6 +737,18 @@ def review():
 def apply():
     """Apply accepted suggestions to files."""
     try:
+        from .queue import QueueManager
+        from .scanner import Scanner
+        from .applier import Applier, Suggestion
+        from .hashing import HashStorage
+        from .detector import ChangeDetector
+        from ..utils.response_schemas import (
+            ModuleDocstring,
+            ClassDocstring,
+            MethodDocstring,
+            ValidationResult
+        )
+
         # Load config
         config_manager = ConfigManager()
         config = config_manager.load()
@@ -664,7 +774,7 @@ def apply():
 
         applied = 0
         failed = 0
-        modified_files = set()  # Track which files were modified
+        suggestions = []
 
         for task in accepted_tasks:
             if not task.suggestion:
@@ -716,16 +826,19 @@ def apply():
                 suggested_text=suggested_text,
                 task_type=task.task_type
             )
+            suggestions.append(suggestion)
+
+        # Apply all suggestions with one read/write per file
+        modified_files = applier.apply_suggestions(suggestions)
 
-            # Apply
-            if applier.apply_suggestion(suggestion):
-                click.echo(f"✓ {task.file_path}:{task.line_number}")
+        for suggestion in suggestions:
+            if suggestion.applied:
+                click.echo(f"✓ {suggestion.file_path}:{suggestion.line_number}")
                 applied += 1
-                modified_files.add(task.file_path)
                 # Auto-delete applied task from queue
-                queue_manager.delete_task(task.id)
+                queue_manager.delete_task(suggestion.task_id)
             else:
-                click.echo(f"✗ {task.file_path}:{task.line_number}")
+                click.echo(f"✗ {suggestion.file_path}:{suggestion.line_number}")
                 failed += 1
 
         click.echo(f"\n✓ Applied {applied} change(s)")
@@ -735,17 +848,14 @@ def apply():
         # Update hashes for modified files to prevent re-detection
         if modified_files:
             click.echo(f"\n🔄 Updating content hashes for {len(modified_files)} file(s)...")
-            for file_path in modified_files:
+            for file_path, content in modified_files.items():
                 try:
-                    # Re-scan the file to get updated blocks
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
+                    # Re-scan the content the applier just wrote (no re-read)
                     blocks = scanner.marker_detector.detect_blocks(content, file_path)
 
                     # Recalculate and update hashes
                     from ..utils.content_hash import ContentHasher
-                    current_hashes = ContentHasher.calculate_all_hashes(file_path, blocks)
+                    current_hashes = ContentHasher.calculate_all_hashes(file_path, blocks, content)
                     detector.update_stored_hashes(file_path, current_hashes)
 
                 except Exception as e:
@@ -764,6 +874,8 @@ def apply():
 def status():
     """Show queue status and statistics."""
     try:
+        from .queue import QueueManager
+
         queue_manager = QueueManager()
         stats = queue_manager.get_stats()
 
@@ -784,6 +896,8 @@ def status():
 def clear():
     """Clear all tasks from the queue."""
     try:
+        from .queue import QueueManager
+
         queue_manager = QueueManager()
 
         if click.confirm("Clear ALL tasks from queue?"):
@@ -800,6 +914,9 @@ def clear():
 def rollback(file_path):
     """Rollback a file to its last backup."""
     try:
+        from .queue import QueueManager
+        from .applier import Applier
+
         config_manager = ConfigManager()
         config = config_manager.load()
 
@@ -4,26 +4,63 @@ Configuration management for LLM Doc Manager.
 Handles loading, saving, and validating configuration settings.
 """
 
+import copy
 import os
-import yaml
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, field, asdict
+from typing import ClassVar, Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
 
 from ..utils.logger_setup import get_logger
 
 logger = get_logger(__name__)
 
-# Load environment variables from .env file in tool's directory
-try:
-    from dotenv import load_dotenv
+# ${VAR_NAME} references in config values
+ENV_VAR_PATTERN = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+
+def section_to_dict(section: Any) -> Dict[str, Any]:
+    """
+    Convert a flat config dataclass to a dict.
+
+    Cheaper than dataclasses.asdict, which deep-copies recursively: the
+    config sections only hold scalars and lists of strings, so copying
+    the instance dict (and its lists) is enough for an independent result.
+
+    Args:
+        section: LLMConfig, ScanningConfig or OutputConfig instance
+
+    Returns:
+        Field name -> value, in field order
+    """
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in vars(section).items()
+    }
+
+
+@lru_cache(maxsize=None)
+def load_env_file() -> bool:
+    """
+    Load environment variables from the .env file in the tool's directory.
+
+    Runs once, on first use, so commands that never read provider settings
+    (e.g. --help) don't pay for importing python-dotenv.
+
+    Returns:
+        True if a .env file was loaded, False otherwise
+    """
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False  # python-dotenv not installed, skip
+
     # Get the tool's root directory (parent of llm_doc_manager package)
-    TOOL_ROOT = Path(__file__).parent.parent.parent
-    ENV_FILE = TOOL_ROOT / ".env"
-    if ENV_FILE.exists():
-        load_dotenv(ENV_FILE)
-except ImportError:
-    pass  # python-dotenv not installed, skip
+    env_file = Path(__file__).parent.parent.parent / ".env"
+    if env_file.exists():
+        return load_dotenv(env_file)
+    return False
 
 
 @dataclass
@@ -35,9 +72,17 @@ class LLMConfig:
     base_url: Optional[str] = None
     temperature: float = 0.5
     max_tokens: int = 4000
+    timeout: Optional[float] = 120.0  # Seconds per LLM request (None = SDK default)
+    max_retries: Optional[int] = 3  # SDK retries on rate limits/server errors (None = SDK default)
+    max_concurrency: int = 10  # LLM requests in flight at once
+    rate_limit_rpm: Optional[int] = 100  # Requests per minute (None = unlimited)
+    rate_limit_tpm: Optional[int] = None  # Tokens per minute, estimated before each call (None = unlimited)
+    enable_prompt_cache: bool = True  # Send template instructions as a cacheable system prompt
 
     def __post_init__(self):
         """Load configuration from environment variables based on provider."""
+        load_env_file()
+
         # Map provider to environment variable prefix
         prefix_map = {
             'openai': 'OPENAI',
@@ -78,7 +123,9 @@ class ScanningConfig:
     exclude: List[str] = field(default_factory=lambda: [
         "*.pyc", "__pycache__", ".venv", "venv", ".git", "node_modules"
     ])
-    max_file_size_mb: int = 5
+    max_file_size_mb: float = 5
+    parallel: bool = True  # Scan files in a process pool (large scans only)
+    workers: int = 0  # Scan processes (0 = one per CPU)
 
 
 @dataclass
@@ -88,6 +135,7 @@ class OutputConfig:
     backup: bool = True
     backup_dir: str = ".llm-doc-manager/backups"
     docs_dir: str = ".llm-doc-manager/docs"  # Directory for generated documentation
+    max_concurrent_io: int = 16  # Max files read/written in parallel by apply
 
 
 @dataclass
@@ -111,9 +159,9 @@ class Config:
     def to_dict(self) -> Dict[str, Any]:
         """Convert Config to dictionary."""
         return {
-            'llm': asdict(self.llm),
-            'scanning': asdict(self.scanning),
-            'output': asdict(self.output),
+            'llm': section_to_dict(self.llm),
+            'scanning': section_to_dict(self.scanning),
+            'output': section_to_dict(self.output),
             'project_root': self.project_root
         }
 
@@ -124,6 +172,10 @@ class ConfigManager:
     DEFAULT_CONFIG_DIR = ".llm-doc-manager"
     DEFAULT_CONFIG_FILE = "config.yaml"
 
+    # Parsed YAML per config path with the (mtime_ns, size) it was read at,
+    # shared by all instances
+    _yaml_cache: ClassVar[Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]]] = {}
+
     def __init__(self, project_root: Optional[str] = None):
         """
         Initialize ConfigManager.
@@ -154,8 +206,7 @@ class ConfigManager:
     def _load_from_file(self) -> Config:
         """Load configuration from YAML file."""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+            data = copy.deepcopy(self._read_yaml())
 
             # Resolve environment variables
             data = self._resolve_env_vars(data)
@@ -172,6 +223,34 @@ class ConfigManager:
             config.project_root = str(self.project_root)
             return config
 
+    def _read_yaml(self) -> Dict[str, Any]:
+        """
+        Parse the config file, reusing the result while the file is unchanged.
+
+        Only the raw YAML is cached: environment variables are resolved
+        on every load, so changes to them are always picked up.
+
+        Returns:
+            Parsed YAML data (shared - callers must copy before mutating)
+        """
+        path = str(self.config_file.resolve())
+        stat = self.config_file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._yaml_cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        import yaml
+        # Prefer libyaml's C loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=loader) or {}
+        self._yaml_cache[path] = (signature, data)
+
+        return data
+
     def save(self, config: Config):
         """
         Save configuration to file.
@@ -179,10 +258,15 @@ class ConfigManager:
         Args:
             config: Configuration to save
         """
+        import yaml
+        # Prefer libyaml's C emitter when PyYAML was built with it
+        dumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
         with open(self.config_file, 'w', encoding='utf-8') as f:
-            yaml.dump(config.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config.to_dict(), f, Dumper=dumper,
+                      default_flow_style=False, sort_keys=False)
 
     def init_config(self, overwrite: bool = False) -> bool:
         """
@@ -217,17 +301,18 @@ class ConfigManager:
         """
         Recursively resolve environment variables in configuration.
 
-        Supports ${VAR_NAME} syntax.
+        Supports ${VAR_NAME} syntax anywhere in a string value; unknown
+        variables are left as written.
         """
         if isinstance(data, dict):
             return {k: self._resolve_env_vars(v) for k, v in data.items()}
         elif isinstance(data, list):
             return [self._resolve_env_vars(item) for item in data]
-        elif isinstance(data, str):
-            # Replace ${VAR_NAME} with environment variable value
-            if data.startswith('${') and data.endswith('}'):
-                var_name = data[2:-1]
-                return os.environ.get(var_name, data)
+        elif isinstance(data, str) and '${' in data:
+            # Replace each ${VAR_NAME} with environment variable value
+            return ENV_VAR_PATTERN.sub(
+                lambda match: os.environ.get(match.group(1), match.group(0)), data
+            )
         return data
 
     def get_api_key(self, config: Config) -> Optional[str]:
@@ -243,6 +328,8 @@ class ConfigManager:
         if config.llm.api_key:
             return config.llm.api_key
 
+        load_env_file()
+
         # Try environment variables based on provider
         env_vars = {
             'anthropic': 'ANTHROPIC_API_KEY',
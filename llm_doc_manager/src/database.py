@@ -51,6 +51,10 @@ class DatabaseManager:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        # Write-ahead log: readers don't block the writer and commits append
+        # to the log instead of rewriting pages (persists in the db file)
+        cursor.execute("PRAGMA journal_mode=WAL")
+
         # ============================================
         # TABLE 1: documentation_tasks (workflow)
         # ============================================
@@ -80,7 +84,8 @@ class DatabaseManager:
                     error_message TEXT,
                     suggestion TEXT,
                     accepted INTEGER DEFAULT 0,
-                    scope_name TEXT
+                    scope_name TEXT,
+                    batch_id TEXT
                 )
             """)
 
@@ -115,13 +120,27 @@ class DatabaseManager:
                     error_message TEXT,
                     suggestion TEXT,
                     accepted INTEGER DEFAULT 0,
-                    scope_name TEXT
+                    scope_name TEXT,
+                    batch_id TEXT
                 )
             """)
 
+        # Migration: add batch_id column (OpenAI Batch API job id)
+        cursor.execute("PRAGMA table_info(documentation_tasks)")
+        task_columns = {row[1] for row in cursor.fetchall()}
+        if 'batch_id' not in task_columns:
+            logger.info("Migrating documentation_tasks: adding batch_id column")
+            cursor.execute("ALTER TABLE documentation_tasks ADD COLUMN batch_id TEXT")
+
+        # Status lookups are FIFO (ORDER BY created_at): with the sort key in
+        # the index, rows stream in order instead of being sorted in memory.
+        # Replaces the former single-column status/accepted indexes.
+        cursor.execute("DROP INDEX IF EXISTS idx_documentation_tasks_status")
+        cursor.execute("DROP INDEX IF EXISTS idx_documentation_tasks_accepted")
+
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_documentation_tasks_status
-            ON documentation_tasks(status)
+            CREATE INDEX IF NOT EXISTS idx_documentation_tasks_status_created
+            ON documentation_tasks(status, created_at)
         """)
 
         cursor.execute("""
@@ -129,9 +148,10 @@ class DatabaseManager:
             ON documentation_tasks(file_path)
         """)
 
+        # Accepted tasks are applied per file, bottom-up
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_documentation_tasks_accepted
-            ON documentation_tasks(accepted)
+            CREATE INDEX IF NOT EXISTS idx_documentation_tasks_accepted_order
+            ON documentation_tasks(accepted, file_path, line_number DESC)
         """)
 
         # ============================================
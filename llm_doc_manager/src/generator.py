@@ -326,9 +326,9 @@ class DocsGenerator:
         # Check if file has valid module markers
         try:
             content = file_path.read_text(encoding="utf-8")
-            blocks = self.marker_detector.detect_blocks(content, str(file_path))
+            blocks = self.marker_detector.iter_blocks(content, str(file_path))
 
-            # Only include files with MODULE_DOC markers
+            # Only include files with MODULE_DOC markers (stops at the first one)
             has_module_markers = any(block.marker_type == MarkerType.MODULE_DOC for block in blocks)
 
             if not has_module_markers:
@@ -5,16 +5,24 @@ Handles communication with LLM providers to generate, validate, and improve docu
 """
 
 import json
+import re
+import threading
+from functools import lru_cache
+from string import Formatter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import ClassVar, Dict, Any, Iterator, Optional, List, Tuple, Union
+from contextlib import contextmanager
 from dataclasses import dataclass
 
+from pydantic import create_model
+
 from .config import Config, ConfigManager
 from .queue import DocTask, QueueManager, TaskStatus
 from .constants import TASK_PROCESSING_ORDER
 from ..utils.docstring_handler import extract_docstring
 from ..utils.logger_setup import get_logger
-from ..utils.llm_client import LLMClientFactory
+from ..utils.llm_client import LLMClientFactory, RateLimiter
 from ..utils.response_schemas import (
     ModuleDocstring,
     ClassDocstring,
@@ -39,6 +47,40 @@ TASK_SCHEMAS = {
 }
 
 
+# Instructions prepended when several tasks share one LLM request
+BATCH_PROMPT_HEADER = (
+    "You will receive {count} independent tasks, labelled TASK 1 to TASK {count}.\n"
+    "Solve each task exactly as if it had been sent on its own, then return "
+    "one result per task in the `results` list, in the same order as the tasks.\n"
+)
+
+# Buffered results are written to the queue once this many have accumulated
+RESULT_FLUSH_SIZE = 50
+
+# Rough prompt size ratio for English text and code (TPM estimates only)
+CHARS_PER_TOKEN = 4
+
+# Markdown code fence that providers without Structured Outputs wrap JSON in
+CODE_FENCE_PATTERN = re.compile(r'^\s*```(?:json|python)?[ \t]*\n?(.*?)\n?```\s*$', re.DOTALL)
+
+
+@lru_cache(maxsize=4)
+def _create_llm_client(provider: str, model: str, api_key: Optional[str],
+                       base_url: Optional[str], temperature: float, max_tokens: int,
+                       timeout: Optional[float], max_retries: Optional[int]):
+    """Create an LLM client, reusing it for Processors with the same settings."""
+    return LLMClientFactory.create(
+        provider=provider,
+        model=model,
+        api_key=api_key,
+        base_url=base_url,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        max_retries=max_retries
+    )
+
+
 @dataclass
 class ProcessResult:
     """Result of processing a documentation task."""
@@ -52,6 +94,10 @@ class ProcessResult:
 class Processor:
     """Processes documentation tasks using LLM."""
 
+    # Templates and their split parts (see _split_template), read once and
+    # shared by all instances
+    _template_cache: ClassVar[Optional[Tuple[Dict[str, str], Dict[str, Tuple[str, str]]]]] = None
+
     def __init__(self, config: Config, queue_manager: QueueManager):
         """
         Initialize Processor.
@@ -67,19 +113,34 @@ class Processor:
         config_manager = ConfigManager()
         api_key = config_manager.get_api_key(config)
 
-        self.llm_client = LLMClientFactory.create(
-            provider=config.llm.provider,
-            model=config.llm.model,
-            api_key=api_key,
-            base_url=config.llm.base_url,
-            temperature=config.llm.temperature,
-            max_tokens=config.llm.max_tokens
+        self.llm_client = _create_llm_client(
+            config.llm.provider,
+            config.llm.model,
+            api_key,
+            config.llm.base_url,
+            config.llm.temperature,
+            config.llm.max_tokens,
+            config.llm.timeout,
+            config.llm.max_retries
         )
 
-        self.templates = self._load_templates()
+        self.templates, self.template_parts = self._load_templates()
+        self._batch_schemas: Dict[str, Any] = {}
+
+        # Shared by all worker threads so concurrency never exceeds the RPM budget
+        self.rate_limiter = RateLimiter(config.llm.rate_limit_rpm, config.llm.rate_limit_tpm)
+
+        # Task outcomes waiting to be written in one transaction (see batched_writes)
+        self.buffer_results = False
+        self._result_buffer: List[Tuple[int, TaskStatus, Optional[str], Optional[str]]] = []
+        self._buffer_lock = threading.Lock()
+
+    @classmethod
+    def _load_templates(cls) -> Tuple[Dict[str, str], Dict[str, Tuple[str, str]]]:
+        """Load prompt templates (once per process) and split them."""
+        if cls._template_cache is not None:
+            return cls._template_cache
 
-    def _load_templates(self) -> Dict[str, str]:
-        """Load prompt templates."""
         templates = {}
         template_dir = Path(__file__).parent.parent / "templates"
 
@@ -100,7 +161,48 @@ class Processor:
                 with open(template_path, 'r', encoding='utf-8') as f:
                     templates[key] = f.read()
 
-        return templates
+        template_parts = {
+            key: cls._split_template(template) for key, template in templates.items()
+        }
+        cls._template_cache = (templates, template_parts)
+        return cls._template_cache
+
+    @staticmethod
+    def _split_template(template: str) -> Tuple[str, str]:
+        """
+        Split a template into its static instructions and per-task part.
+
+        The cut is made at the section heading (or line) holding the first
+        {placeholder}, so instructions + "\n" + task part gives the same
+        prompt as the whole template.
+
+        Args:
+            template: Prompt template text
+
+        Returns:
+            (instructions, task_template); instructions are already
+            formatted (no placeholders) and empty if the template has no
+            placeholders or starts with one
+        """
+        first_field = None
+        offset = 0
+        for literal, field_name, _, _ in Formatter().parse(template):
+            offset += len(literal)
+            if field_name is not None:
+                first_field = offset
+                break
+
+        if first_field is None:
+            return "", template
+
+        line_start = template.rfind('\n', 0, first_field)
+        heading = template.rfind('\n#', 0, first_field)
+        cut = heading if heading != -1 else line_start
+        if cut <= 0:
+            return "", template
+
+        # format() only unescapes {{ }}: there are no fields before the cut
+        return template[:cut].format(), template[cut + 1:]
 
     def process_task(self, task: DocTask) -> ProcessResult:
         """
@@ -113,11 +215,12 @@ class Processor:
             ProcessResult with the outcome
         """
         try:
-            # Update task status to processing
-            self.queue_manager.update_task_status(task.id, TaskStatus.PROCESSING)
+            # Update task status to processing (skipped while buffering writes)
+            if not self.buffer_results:
+                self.queue_manager.update_task_status(task.id, TaskStatus.PROCESSING)
 
-            # Generate prompt based on task type
-            prompt = self._generate_prompt(task)
+            # Generate prompt based on task type (shared instructions as system)
+            system, prompt = self._generate_prompt_parts(task)
 
             # Print prompt if debug mode is enabled
             if getattr(self, 'debug', False):
@@ -125,6 +228,9 @@ class Processor:
                 print("\n" + "="*80)
                 print(f"PROMPT FOR TASK {task.id} ({task.task_type}):")
                 print("="*80)
+                if system:
+                    print(system)
+                    print("-"*80)
                 print(prompt)
                 print("="*80 + "\n")
 
@@ -132,44 +238,316 @@ class Processor:
             schema = TASK_SCHEMAS.get(task.task_type)
 
             # Call LLM with structured schema
-            response, tokens = self.llm_client.call(prompt, json_schema=schema)
+            self.rate_limiter.acquire(self._estimate_tokens(system, prompt))
+            response, tokens = self.llm_client.call(prompt, json_schema=schema, system=system)
 
             # Parse response and format as docstring/comment
             suggestion = self._parse_and_format_response(response, task)
 
-            # Convert Pydantic objects to JSON string for database storage
-            if isinstance(suggestion, (ModuleDocstring, ClassDocstring, MethodDocstring)):
-                suggestion_for_db = suggestion.model_dump_json()
-            else:
-                # Already a string (CommentText or ValidationResult)
-                suggestion_for_db = suggestion
+            return self._complete_task(task, suggestion, tokens)
+
+        except Exception as e:
+            return self._fail_task(task, e)
 
-            # Save suggestion to database
-            self.queue_manager.update_suggestion(task.id, suggestion_for_db)
+    def process_tasks_batch(self, tasks: List[DocTask]) -> List[ProcessResult]:
+        """
+        Process several tasks of the same type with a single LLM request.
 
-            # Update task status to completed
-            self.queue_manager.update_task_status(task.id, TaskStatus.COMPLETED)
+        The individual prompts are packed into one message under numbered
+        labels and the model returns a list with one structured result per
+        task. Falls back to one request per task when the batch has a
+        single task, mixes task types, the provider cannot enforce the
+        list schema, or the response does not contain one result per task.
 
-            return ProcessResult(
-                task_id=task.id,
-                success=True,
-                suggestion=suggestion,
-                tokens_used=tokens
+        Args:
+            tasks: Tasks to process (see make_batches)
+
+        Returns:
+            List of ProcessResults, one per task, in input order
+        """
+        task_types = {task.task_type for task in tasks}
+        schema = TASK_SCHEMAS.get(tasks[0].task_type) if tasks else None
+
+        if (len(tasks) < 2 or len(task_types) > 1 or schema is None
+                or not self.llm_client.supports_structured_outputs):
+            return [self.process_task(task) for task in tasks]
+
+        try:
+            if not self.buffer_results:
+                for task in tasks:
+                    self.queue_manager.update_task_status(task.id, TaskStatus.PROCESSING)
+
+            # Same task type, so the instructions are identical: send them once
+            parts = [self._generate_prompt_parts(task) for task in tasks]
+            system = parts[0][0]
+            prompt = BATCH_PROMPT_HEADER.format(count=len(tasks)) + "\n\n".join(
+                f"### TASK {index}\n\n{task_prompt}"
+                for index, (_, task_prompt) in enumerate(parts, start=1)
             )
 
+            if getattr(self, 'debug', False):
+                print()
+                print("\n" + "="*80)
+                print(f"BATCH PROMPT FOR TASKS {[task.id for task in tasks]} ({tasks[0].task_type}):")
+                print("="*80)
+                if system:
+                    print(system)
+                    print("-"*80)
+                print(prompt)
+                print("="*80 + "\n")
+
+            self.rate_limiter.acquire(self._estimate_tokens(system, prompt))
+            response, tokens = self.llm_client.call(
+                prompt, json_schema=self._get_batch_schema(tasks[0].task_type), system=system
+            )
+            items = json.loads(self._strip_code_fence(response))['results']
         except Exception as e:
-            # Update task status to failed
-            self.queue_manager.update_task_status(
-                task.id,
-                TaskStatus.FAILED,
-                error_message=str(e)
+            logger.warning(f"Batch request failed ({e}) - processing tasks one by one")
+            return [self.process_task(task) for task in tasks]
+
+        if len(items) != len(tasks):
+            logger.warning(
+                f"Batch returned {len(items)} results for {len(tasks)} tasks - "
+                f"processing tasks one by one"
+            )
+            return [self.process_task(task) for task in tasks]
+
+        # Attribute tokens evenly (remainder to the first task)
+        share, remainder = divmod(tokens, len(tasks))
+
+        results = []
+        for index, (task, item) in enumerate(zip(tasks, items)):
+            try:
+                suggestion = self._parse_and_format_response(json.dumps(item), task)
+                results.append(self._complete_task(
+                    task, suggestion, share + (remainder if index == 0 else 0)
+                ))
+            except Exception as e:
+                results.append(self._fail_task(task, e))
+
+        return results
+
+    def process_batches_concurrently(
+        self,
+        batches: List[List[DocTask]]
+    ) -> Iterator[Tuple[List[DocTask], List[ProcessResult]]]:
+        """
+        Process batches with up to llm.max_concurrency requests in flight.
+
+        LLM calls are network-bound, so overlapping them in threads cuts
+        wall time to roughly the slowest request per wave. Requests are
+        still paced by the shared rate limiter (llm.rate_limit_rpm).
+
+        Args:
+            batches: Task batches (see make_batches)
+
+        Yields:
+            (batch, results) tuples in completion order
+        """
+        if not batches:
+            return
+
+        max_workers = max(1, min(self.config.llm.max_concurrency, len(batches)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.process_tasks_batch, batch): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def submit_batch_job(self, tasks: List[DocTask]) -> str:
+        """
+        Submit tasks as one offline provider batch job.
+
+        Uses the OpenAI Batch API or the Anthropic Message Batches API.
+        Batch jobs are billed at a discount and are not subject to the
+        per-minute rate limit, but results arrive asynchronously (within
+        24h). Tasks are marked PROCESSING and tagged with the job ID;
+        collect_batch_job stores their suggestions once the job finishes.
+
+        Args:
+            tasks: Tasks to submit
+
+        Returns:
+            Provider batch job ID
+        """
+        if not self.llm_client.supports_batch:
+            raise ValueError(
+                f"Provider '{self.config.llm.provider}' does not support batch jobs"
             )
 
-            return ProcessResult(
-                task_id=task.id,
-                success=False,
-                error=str(e)
+        requests = [
+            (str(task.id), self._generate_prompt(task), TASK_SCHEMAS.get(task.task_type))
+            for task in tasks
+        ]
+        batch_id = self.llm_client.submit_batch(requests)
+
+        # Job ID and PROCESSING status in one transaction, so a task is never
+        # left PENDING while tagged with a job
+        self.queue_manager.set_batch_id(
+            [task.id for task in tasks], batch_id, TaskStatus.PROCESSING
+        )
+
+        logger.info(f"Submitted {len(tasks)} tasks in batch job {batch_id}")
+        return batch_id
+
+    def collect_batch_job(self, batch_id: str) -> Optional[List[ProcessResult]]:
+        """
+        Store the results of a finished batch job.
+
+        Args:
+            batch_id: Provider batch job ID (see submit_batch_job)
+
+        Returns:
+            List of ProcessResults for the tasks still waiting on the job,
+            or None if the job has not finished yet
+        """
+        status, responses = self.llm_client.retrieve_batch(batch_id)
+        if responses is None:
+            logger.info(f"Batch job {batch_id} still {status}")
+            return None
+
+        results = []
+        with self.batched_writes():
+            for task in self.queue_manager.get_tasks_by_batch(batch_id):
+                if task.status != TaskStatus.PROCESSING.value:
+                    continue
+
+                try:
+                    if str(task.id) not in responses:
+                        raise RuntimeError(f"No result in batch job {batch_id} (job {status})")
+                    response, tokens = responses[str(task.id)]
+                    suggestion = self._parse_and_format_response(response, task)
+                    results.append(self._complete_task(task, suggestion, tokens))
+                except Exception as e:
+                    results.append(self._fail_task(task, e))
+
+        return results
+
+    @staticmethod
+    def make_batches(tasks: List[DocTask], batch_size: int) -> List[List[DocTask]]:
+        """
+        Split tasks into batches for process_tasks_batch.
+
+        Tasks are grouped by task_type (one schema per request), keeping
+        the first-seen order of types and of tasks within a type.
+
+        Args:
+            tasks: Tasks to split
+            batch_size: Maximum tasks per batch (1 disables batching)
+
+        Returns:
+            List of task batches
+        """
+        if batch_size <= 1:
+            return [[task] for task in tasks]
+
+        tasks_by_type: Dict[str, List[DocTask]] = {}
+        for task in tasks:
+            tasks_by_type.setdefault(task.task_type, []).append(task)
+
+        return [
+            group[start:start + batch_size]
+            for group in tasks_by_type.values()
+            for start in range(0, len(group), batch_size)
+        ]
+
+    def _estimate_tokens(self, system: str, prompt: str) -> int:
+        """
+        Estimate the tokens a request may use, for the TPM budget.
+
+        Uses ~4 characters per prompt token plus the full completion
+        allowance (max_tokens), so the estimate errs on the high side.
+        """
+        return (len(system) + len(prompt)) // CHARS_PER_TOKEN + self.config.llm.max_tokens
+
+    @staticmethod
+    def _strip_code_fence(response: str) -> str:
+        """Return the body of a fenced response, or the response unchanged."""
+        match = CODE_FENCE_PATTERN.match(response)
+        return match.group(1) if match else response
+
+    def _get_batch_schema(self, task_type: str):
+        """Get (and cache) the list-of-results schema for a task type."""
+        if task_type not in self._batch_schemas:
+            schema = TASK_SCHEMAS[task_type]
+            self._batch_schemas[task_type] = create_model(
+                f"{schema.__name__}Batch",
+                results=(List[schema], ...)
             )
+        return self._batch_schemas[task_type]
+
+    def _complete_task(self, task: DocTask, suggestion, tokens: int) -> ProcessResult:
+        """Store a suggestion and mark its task completed."""
+        # Convert Pydantic objects to JSON string for database storage
+        if isinstance(suggestion, (ModuleDocstring, ClassDocstring, MethodDocstring)):
+            suggestion_for_db = suggestion.model_dump_json()
+        else:
+            # Already a string (CommentText or ValidationResult)
+            suggestion_for_db = suggestion
+
+        # Save suggestion and mark completed (one UPDATE)
+        self._record_result(task.id, TaskStatus.COMPLETED, suggestion_for_db, None)
+
+        return ProcessResult(
+            task_id=task.id,
+            success=True,
+            suggestion=suggestion,
+            tokens_used=tokens
+        )
+
+    def _fail_task(self, task: DocTask, error: Exception) -> ProcessResult:
+        """Mark a task failed and build its result."""
+        # Update task status to failed
+        self._record_result(task.id, TaskStatus.FAILED, None, str(error))
+
+        return ProcessResult(
+            task_id=task.id,
+            success=False,
+            error=str(error)
+        )
+
+    def _record_result(self, task_id: int, status: TaskStatus,
+                       suggestion: Optional[str], error_message: Optional[str]):
+        """Write a task outcome now, or buffer it inside batched_writes()."""
+        row = (task_id, status, suggestion, error_message)
+
+        if not self.buffer_results:
+            self.queue_manager.save_results([row])
+            return
+
+        with self._buffer_lock:
+            self._result_buffer.append(row)
+            full = len(self._result_buffer) >= RESULT_FLUSH_SIZE
+
+        if full:
+            self.flush_results()
+
+    def flush_results(self):
+        """Write all buffered task outcomes in a single transaction."""
+        with self._buffer_lock:
+            rows, self._result_buffer = self._result_buffer, []
+
+        self.queue_manager.save_results(rows)
+
+    @contextmanager
+    def batched_writes(self):
+        """
+        Buffer task outcomes and write them in a few transactions.
+
+        Inside the block, results are queued in memory and written every
+        RESULT_FLUSH_SIZE tasks and on exit (also on errors), instead of
+        committing each task on its own. Tasks are not marked PROCESSING
+        while in flight, so an interrupted run leaves them PENDING.
+        """
+        previous = self.buffer_results
+        self.buffer_results = True
+        try:
+            yield self
+        finally:
+            self.buffer_results = previous
+            self.flush_results()
 
     def process_queue(self, limit: Optional[int] = None) -> List[ProcessResult]:
         """
@@ -186,7 +564,13 @@ class Processor:
         8. validate_comment
 
         This ensures module documentation is completed before class docs,
-        and class docs before method docs.
+        and class docs before method docs. Each type is one wave: its
+        tasks are dispatched concurrently (see process_batches_concurrently)
+        and the next type starts once the wave has finished.
+
+        Each wave is claimed (marked PROCESSING) in one atomic query, so
+        concurrent runs never process the same task; claimed tasks left
+        without an outcome are returned to PENDING on exit.
 
         Args:
             limit: Maximum number of tasks to process
@@ -194,46 +578,47 @@ class Processor:
         Returns:
             List of ProcessResults
         """
-        # Get all pending tasks
-        all_pending = self.queue_manager.get_pending_tasks(limit=None)
-
-        # Group tasks by type
-        tasks_by_type: Dict[str, List[DocTask]] = {}
-        for task in all_pending:
-            task_type = task.task_type
-            if task_type not in tasks_by_type:
-                tasks_by_type[task_type] = []
-            tasks_by_type[task_type].append(task)
-
-        # Process tasks in TASK_PROCESSING_ORDER
         results = []
-        processed_count = 0
-
-        for task_type in TASK_PROCESSING_ORDER:
-            if limit and processed_count >= limit:
-                break
-
-            tasks_of_type = tasks_by_type.get(task_type, [])
+        processed_types = []
+        claimed_ids: List[int] = []
 
-            for task in tasks_of_type:
-                if limit and processed_count >= limit:
-                    break
-
-                logger.info(f"Processing task {task.id} of type '{task_type}'")
-                result = self.process_task(task)
-                results.append(result)
-                processed_count += 1
+        try:
+            with self.batched_writes():
+                for task_type in TASK_PROCESSING_ORDER:
+                    remaining = limit - len(results) if limit else None
+                    if limit and remaining <= 0:
+                        break
+
+                    # Claim the wave atomically so concurrent runs never share a task
+                    tasks_of_type = self.queue_manager.claim_pending_tasks(task_type, remaining)
+                    if not tasks_of_type:
+                        continue
+                    claimed_ids.extend(task.id for task in tasks_of_type)
+
+                    logger.info(f"Processing {len(tasks_of_type)} task(s) of type '{task_type}'")
+                    results_by_id = {
+                        batch[0].id: batch_results[0]
+                        for batch, batch_results in self.process_batches_concurrently(
+                            [[task] for task in tasks_of_type]
+                        )
+                    }
+
+                    # Report results in queue order, not completion order
+                    results.extend(results_by_id[task.id] for task in tasks_of_type)
+                    processed_types.append(task_type)
+        finally:
+            # Tasks left without an outcome (interrupted run) go back to PENDING
+            self.queue_manager.release_tasks(claimed_ids)
 
         logger.info(
-            f"Processed {processed_count} tasks in order: "
-            f"{', '.join([t for t in TASK_PROCESSING_ORDER if t in tasks_by_type])}"
+            f"Processed {len(results)} tasks in order: {', '.join(processed_types)}"
         )
 
         return results
 
     def _generate_prompt(self, task: DocTask) -> str:
         """
-        Generate prompt for LLM based on task.
+        Generate the complete prompt for LLM based on task.
 
         Args:
             task: Documentation task
@@ -241,6 +626,27 @@ class Processor:
         Returns:
             Formatted prompt string
         """
+        _, prompt = self._generate_prompt_parts(task, split=False)
+        return prompt
+
+    def _generate_prompt_parts(self, task: DocTask, split: Optional[bool] = None) -> Tuple[str, str]:
+        """
+        Generate prompt for LLM based on task, split for prompt caching.
+
+        The static instructions of the template are identical for every
+        task of a type; sent as the system message they form a stable
+        prefix that providers can cache (OpenAI automatically, Anthropic
+        via cache_control) and that batched requests include only once.
+
+        Args:
+            task: Documentation task
+            split: Separate the instructions (default: llm.enable_prompt_cache)
+
+        Returns:
+            (system, prompt) - system is empty when not split
+        """
+        if split is None:
+            split = self.config.llm.enable_prompt_cache
         task_type = task.task_type
 
         # Map task type to template key
@@ -266,7 +672,10 @@ class Processor:
                 f"Check that cli.py is using one of the supported task types."
             )
 
-        template = self.templates.get(template_key, "")
+        if split:
+            system, template = self.template_parts.get(template_key, ("", ""))
+        else:
+            system, template = "", self.templates.get(template_key, "")
 
         # For validate tasks, extract current docstring/comment
         if task_type.startswith("validate_"):
@@ -285,7 +694,7 @@ class Processor:
                 context=task.context
             )
 
-        return prompt
+        return system, prompt
 
     def _extract_current_docstring(self, context: str) -> str:
         """
@@ -320,35 +729,27 @@ class Processor:
             Union[ModuleDocstring, ClassDocstring, MethodDocstring, str]: Schema object or formatted string
         """
         try:
-            parsed_json = json.loads(response)
+            parsed_json = json.loads(self._strip_code_fence(response))
             task_type = task.task_type
 
-            # GENERATE tasks - return Pydantic object (formatting in applier)
-            if task_type == "generate_module":
-                return ModuleDocstring(**parsed_json)
+            schema = TASK_SCHEMAS.get(task_type)
+            if schema is None:
+                logger.warning(f"Unknown task type: {task_type}")
+                return response
 
-            elif task_type == "generate_class":
-                return ClassDocstring(**parsed_json)
+            schema_obj = schema(**parsed_json)
 
-            elif task_type == "generate_docstring":
-                return MethodDocstring(**parsed_json)
+            # VALIDATE tasks - store full ValidationResult JSON so the
+            # review command can display rationale (issues + suggestions)
+            if task_type.startswith("validate_"):
+                return schema_obj.model_dump_json()
 
-            elif task_type == "generate_comment":
-                # Comments are simple strings - return directly
-                schema_obj = CommentText(**parsed_json)
+            # Comments are simple strings - return directly
+            if task_type == "generate_comment":
                 return schema_obj.comment
 
-            # VALIDATE tasks - return full ValidationResult JSON
-            elif task_type.startswith("validate_"):
-                validation = ValidationResult(**parsed_json)
-
-                # Store full ValidationResult as JSON (preserves issues/suggestions)
-                # This allows the review command to display rationale
-                return validation.model_dump_json()
-
-            else:
-                logger.warning(f"Unknown task type: {task_type}")
-                return response
+            # GENERATE tasks - return Pydantic object (formatting in applier)
+            return schema_obj
 
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.error(f"Error parsing structured response: {e}")
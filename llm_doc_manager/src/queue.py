@@ -9,10 +9,12 @@ Line Number Convention:
 """
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Iterator, List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, fields
 from enum import Enum
 
 
@@ -41,10 +43,23 @@ class DocTask:
     suggestion: Optional[str] = None  # LLM-generated suggestion
     accepted: bool = False  # Whether user accepted the suggestion
     scope_name: Optional[str] = None  # Name of class/method being documented
+    batch_id: Optional[str] = None  # Provider batch job the task was submitted in
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (shallow: every field is a scalar)."""
+        return dict(vars(self))
+
+    def to_row(self, now: str) -> Tuple[Any, ...]:
+        """
+        Build the INSERT values for this task (see INSERT_COLUMNS).
+
+        Args:
+            now: Timestamp stored as created_at and updated_at
+
+        Returns:
+            Column values in INSERT_COLUMNS order
+        """
+        return tuple(getattr(self, name) for name in TASK_VALUE_COLUMNS) + (now, now)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DocTask':
@@ -52,6 +67,19 @@ class DocTask:
         return cls(**data)
 
 
+# Task fields copied as-is when a task is added (id is assigned by SQLite
+# and the timestamps are set at insert time)
+TASK_VALUE_COLUMNS = tuple(
+    field.name for field in fields(DocTask)
+    if field.name not in ('id', 'created_at', 'updated_at')
+)
+INSERT_COLUMNS = TASK_VALUE_COLUMNS + ('created_at', 'updated_at')
+INSERT_TASK_QUERY = (
+    f"INSERT INTO documentation_tasks ({', '.join(INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in INSERT_COLUMNS)})"
+)
+
+
 class QueueManager:
     """Manages the task queue using SQLite."""
 
@@ -75,6 +103,40 @@ class QueueManager:
         from .database import DatabaseManager
         DatabaseManager(db_path=self.db_path)
 
+        # One long-lived connection, opened on first use and shared by all
+        # methods (and worker threads, one statement group at a time)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the shared connection; commits on success, rolls back on error.
+
+        Yields:
+            SQLite connection returning sqlite3.Row rows
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.row_factory = sqlite3.Row
+                # Safe with WAL (set by DatabaseManager): no fsync per commit
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+
+            try:
+                yield self._conn
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    def close(self):
+        """Close the shared connection (reopened automatically if used again)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def add_task(self, task: DocTask) -> int:
         """
         Add a task to the queue.
@@ -85,25 +147,33 @@ class QueueManager:
         Returns:
             ID of the added task
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(INSERT_TASK_QUERY, task.to_row(datetime.now().isoformat()))
+            task_id = cursor.lastrowid
+
+        return task_id
+
+    def add_tasks(self, tasks: List[DocTask]) -> int:
+        """
+        Add several tasks to the queue in a single transaction.
 
-        task_dict = task.to_dict()
-        task_dict.pop('id', None)  # Remove id if present
-        task_dict['created_at'] = datetime.now().isoformat()
-        task_dict['updated_at'] = datetime.now().isoformat()
+        Args:
+            tasks: Tasks to add
 
-        columns = ', '.join(task_dict.keys())
-        placeholders = ', '.join(['?' for _ in task_dict])
-        query = f"INSERT INTO documentation_tasks ({columns}) VALUES ({placeholders})"
+        Returns:
+            Number of tasks added
+        """
+        if not tasks:
+            return 0
 
-        cursor.execute(query, list(task_dict.values()))
-        task_id = cursor.lastrowid
+        now = datetime.now().isoformat()
+        rows = [task.to_row(now) for task in tasks]
 
-        conn.commit()
-        conn.close()
+        with self._connect() as conn:
+            conn.executemany(INSERT_TASK_QUERY, rows)
 
-        return task_id
+        return len(rows)
 
     def get_task(self, task_id: int) -> Optional[DocTask]:
         """
@@ -115,14 +185,11 @@ class QueueManager:
         Returns:
             Task or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM documentation_tasks WHERE id = ?", (task_id,))
-        row = cursor.fetchone()
-
-        conn.close()
+            cursor.execute("SELECT * FROM documentation_tasks WHERE id = ?", (task_id,))
+            row = cursor.fetchone()
 
         if row:
             return DocTask.from_dict(dict(row))
@@ -141,24 +208,87 @@ class QueueManager:
         Returns:
             List of pending tasks
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            query = """
+                SELECT * FROM documentation_tasks
+                WHERE status = ?
+                ORDER BY created_at ASC
+            """
+            if limit:
+                query += f" LIMIT {limit}"
 
-        query = """
-            SELECT * FROM documentation_tasks
-            WHERE status = ?
-            ORDER BY created_at ASC
+            cursor.execute(query, (TaskStatus.PENDING.value,))
+            rows = cursor.fetchall()
+
+        return [DocTask.from_dict(dict(row)) for row in rows]
+
+    def claim_pending_tasks(self, task_type: Optional[str] = None,
+                            limit: Optional[int] = None) -> List[DocTask]:
         """
-        if limit:
-            query += f" LIMIT {limit}"
+        Atomically fetch pending tasks and mark them PROCESSING.
 
-        cursor.execute(query, (TaskStatus.PENDING.value,))
-        rows = cursor.fetchall()
+        The write lock is taken before reading, so concurrent workers
+        (threads or processes) never claim the same task.
 
-        conn.close()
+        Args:
+            task_type: Only claim tasks of this type (None for any type)
+            limit: Maximum number of tasks to claim
 
-        return [DocTask.from_dict(dict(row)) for row in rows]
+        Returns:
+            Claimed tasks in FIFO order, with status PROCESSING
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+
+            query = "SELECT * FROM documentation_tasks WHERE status = ?"
+            params: List[Any] = [TaskStatus.PENDING.value]
+            if task_type:
+                query += " AND task_type = ?"
+                params.append(task_type)
+            query += " ORDER BY created_at ASC"
+            if limit:
+                query += f" LIMIT {limit}"
+
+            cursor.execute(query, params)
+            tasks = [DocTask.from_dict(dict(row)) for row in cursor.fetchall()]
+
+            now = datetime.now().isoformat()
+            cursor.executemany("""
+                UPDATE documentation_tasks
+                SET status = ?, updated_at = ?
+                WHERE id = ?
+            """, [(TaskStatus.PROCESSING.value, now, task.id) for task in tasks])
+
+        for task in tasks:
+            task.status = TaskStatus.PROCESSING.value
+            task.updated_at = now
+        return tasks
+
+    def release_tasks(self, task_ids: List[int]):
+        """
+        Return claimed tasks that are still PROCESSING to PENDING.
+
+        Tasks that already have an outcome (completed, failed, ...) are
+        left untouched.
+
+        Args:
+            task_ids: IDs of previously claimed tasks
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            now = datetime.now().isoformat()
+            cursor.executemany("""
+                UPDATE documentation_tasks
+                SET status = ?, updated_at = ?
+                WHERE id = ? AND status = ?
+            """, [
+                (TaskStatus.PENDING.value, now, task_id, TaskStatus.PROCESSING.value)
+                for task_id in task_ids
+            ])
 
     def update_task_status(self, task_id: int, status: TaskStatus,
                           error_message: Optional[str] = None):
@@ -170,17 +300,14 @@ class QueueManager:
             status: New status
             error_message: Optional error message if status is FAILED
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE documentation_tasks
-            SET status = ?, updated_at = ?, error_message = ?
-            WHERE id = ?
-        """, (status.value, datetime.now().isoformat(), error_message, task_id))
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        conn.commit()
-        conn.close()
+            cursor.execute("""
+                UPDATE documentation_tasks
+                SET status = ?, updated_at = ?, error_message = ?
+                WHERE id = ?
+            """, (status.value, datetime.now().isoformat(), error_message, task_id))
 
     def update_task_error(self, task_id: int, error_message: Optional[str]):
         """
@@ -190,17 +317,14 @@ class QueueManager:
             task_id: Task ID
             error_message: Error message (None to clear)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE documentation_tasks
-            SET error_message = ?, updated_at = ?
-            WHERE id = ?
-        """, (error_message, datetime.now().isoformat(), task_id))
-
-        conn.commit()
-        conn.close()
+            cursor.execute("""
+                UPDATE documentation_tasks
+                SET error_message = ?, updated_at = ?
+                WHERE id = ?
+            """, (error_message, datetime.now().isoformat(), task_id))
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -209,31 +333,26 @@ class QueueManager:
         Returns:
             Dictionary with counts for each status
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT status, COUNT(*) as count
-            FROM documentation_tasks
-            GROUP BY status
-        """)
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        stats = {row[0]: row[1] for row in cursor.fetchall()}
-        stats['total'] = sum(stats.values())
+            cursor.execute("""
+                SELECT status, COUNT(*) as count
+                FROM documentation_tasks
+                GROUP BY status
+            """)
 
-        conn.close()
+            stats = {row[0]: row[1] for row in cursor.fetchall()}
+            stats['total'] = sum(stats.values())
 
         return stats
 
     def clear_all(self):
         """Remove all tasks from the queue."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("DELETE FROM documentation_tasks")
-
-        conn.commit()
-        conn.close()
+            cursor.execute("DELETE FROM documentation_tasks")
 
     def get_tasks_by_file(self, file_path: str) -> List[DocTask]:
         """
@@ -245,18 +364,16 @@ class QueueManager:
         Returns:
             List of tasks for the file
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT * FROM documentation_tasks
-            WHERE file_path = ?
-            ORDER BY line_number ASC
-        """, (file_path,))
+            cursor.execute("""
+                SELECT * FROM documentation_tasks
+                WHERE file_path = ?
+                ORDER BY line_number ASC
+            """, (file_path,))
 
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
 
         return [DocTask.from_dict(dict(row)) for row in rows]
 
@@ -270,18 +387,16 @@ class QueueManager:
         Returns:
             List of tasks with the status ordered by creation time
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT * FROM documentation_tasks
-            WHERE status = ?
-            ORDER BY created_at ASC
-        """, (status.value,))
+            cursor.execute("""
+                SELECT * FROM documentation_tasks
+                WHERE status = ?
+                ORDER BY created_at ASC
+            """, (status.value,))
 
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
 
         return [DocTask.from_dict(dict(row)) for row in rows]
 
@@ -293,17 +408,104 @@ class QueueManager:
             task_id: Task ID
             suggestion: Generated suggestion text
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                UPDATE documentation_tasks
+                SET suggestion = ?, updated_at = ?
+                WHERE id = ?
+            """, (suggestion, datetime.now().isoformat(), task_id))
+
+    def save_results(self, results: List[Tuple[int, TaskStatus, Optional[str], Optional[str]]]):
+        """
+        Store the outcome of several tasks in a single transaction.
+
+        Args:
+            results: (task_id, status, suggestion, error_message) per task;
+                     a None suggestion keeps the stored one
+        """
+        if not results:
+            return
+
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            now = datetime.now().isoformat()
+            cursor.executemany("""
+                UPDATE documentation_tasks
+                SET status = ?, suggestion = COALESCE(?, suggestion),
+                    error_message = ?, updated_at = ?
+                WHERE id = ?
+            """, [
+                (status.value, suggestion, error_message, now, task_id)
+                for task_id, status, suggestion, error_message in results
+            ])
+
+    def set_batch_id(self, task_ids: List[int], batch_id: Optional[str],
+                     status: Optional[TaskStatus] = None):
+        """
+        Record the batch job tasks were submitted in, in a single transaction.
+
+        Args:
+            task_ids: IDs of the submitted tasks
+            batch_id: Provider batch job ID (None to clear)
+            status: New status for the tasks (None keeps the current one)
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            now = datetime.now().isoformat()
+            status_value = status.value if status else None
+            cursor.executemany("""
+                UPDATE documentation_tasks
+                SET batch_id = ?, status = COALESCE(?, status), updated_at = ?
+                WHERE id = ?
+            """, [(batch_id, status_value, now, task_id) for task_id in task_ids])
+
+    def get_open_batch_ids(self) -> List[str]:
+        """
+        Get batch jobs that still have tasks waiting for results.
 
-        cursor.execute("""
-            UPDATE documentation_tasks
-            SET suggestion = ?, updated_at = ?
-            WHERE id = ?
-        """, (suggestion, datetime.now().isoformat(), task_id))
+        Returns:
+            Batch job IDs in submission order
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT batch_id FROM documentation_tasks
+                WHERE batch_id IS NOT NULL AND status = ?
+                GROUP BY batch_id
+                ORDER BY MIN(id) ASC
+            """, (TaskStatus.PROCESSING.value,))
 
-        conn.commit()
-        conn.close()
+            batch_ids = [row[0] for row in cursor.fetchall()]
+
+        return batch_ids
+
+    def get_tasks_by_batch(self, batch_id: str) -> List[DocTask]:
+        """
+        Get all tasks submitted in a batch job.
+
+        Args:
+            batch_id: Provider batch job ID
+
+        Returns:
+            List of tasks in the batch ordered by ID
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT * FROM documentation_tasks
+                WHERE batch_id = ?
+                ORDER BY id ASC
+            """, (batch_id,))
+
+            rows = cursor.fetchall()
+
+        return [DocTask.from_dict(dict(row)) for row in rows]
 
     def accept_task(self, task_id: int):
         """
@@ -312,17 +514,14 @@ class QueueManager:
         Args:
             task_id: Task ID
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE documentation_tasks
-            SET accepted = 1, updated_at = ?
-            WHERE id = ?
-        """, (datetime.now().isoformat(), task_id))
-
-        conn.commit()
-        conn.close()
+            cursor.execute("""
+                UPDATE documentation_tasks
+                SET accepted = 1, updated_at = ?
+                WHERE id = ?
+            """, (datetime.now().isoformat(), task_id))
 
     def get_accepted_tasks(self) -> List[DocTask]:
         """
@@ -331,18 +530,16 @@ class QueueManager:
         Returns:
             List of accepted tasks sorted by file_path and line_number DESC
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT * FROM documentation_tasks
-            WHERE accepted = 1
-            ORDER BY file_path ASC, line_number DESC
-        """)
+            cursor.execute("""
+                SELECT * FROM documentation_tasks
+                WHERE accepted = 1
+                ORDER BY file_path ASC, line_number DESC
+            """)
 
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
 
         return [DocTask.from_dict(dict(row)) for row in rows]
 
@@ -353,10 +550,7 @@ class QueueManager:
         Args:
             task_id: Task ID to delete
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM documentation_tasks WHERE id = ?", (task_id,))
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-        conn.commit()
-        conn.close()
+            cursor.execute("DELETE FROM documentation_tasks WHERE id = ?", (task_id,))
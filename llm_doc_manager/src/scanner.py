@@ -6,9 +6,11 @@ created by the sync command after hash-based change detection.
 """
 
 import os
-from fnmatch import fnmatch
+import re
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import translate
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Iterator, List, Optional, Pattern, Set, Tuple
 from dataclasses import dataclass
 
 from ..utils.marker_detector import MarkerDetector
@@ -18,6 +20,16 @@ from ..utils.logger_setup import get_logger
 
 logger = get_logger(__name__)
 
+# Below this many files a process pool costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 200
+
+# Every marker line contains this, so files without it need no decoding
+MARKER_PREFIX_BYTES = b'@llm-'
+
+# Files are searched for MARKER_PREFIX_BYTES this many bytes at a time, so
+# large files without markers are never held in memory as a whole
+READ_CHUNK_BYTES = 64 * 1024
+
 
 @dataclass
 class ScanResult:
@@ -69,37 +81,140 @@ class Scanner:
 
         logger.info(f"Scanning {len(files_to_scan)} file(s) for markers")
 
-        for file_path in files_to_scan:
-            try:
-                # Read file content
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+        for file_result in self._scan_files(files_to_scan):
+            self._add_file_result(result, *file_result)
 
-                # Validate markers first
-                issues = self.validator.validate_file(content, str(file_path))
-                result.validation_issues.extend(issues)
+        return result
 
-                # Check if there are any errors
-                if self.validator.has_errors(issues):
-                    # Don't process this file - has validation errors
-                    logger.warning(f"Skipping {file_path} due to validation errors")
-                    result.files_scanned += 1
-                    continue
+    @staticmethod
+    def _add_file_result(result: ScanResult, file_path: str, issues: list,
+                         blocks: Optional[list], error: Optional[str]):
+        """
+        Add one scan_file_content result to a ScanResult.
+
+        Args:
+            result: ScanResult to update
+            file_path: Scanned file
+            issues: Validation issues found in the file
+            blocks: Detected blocks, or None if the file has validation errors
+            error: Error message if the file could not be scanned
+        """
+        if error:
+            logger.error(error)
+            result.errors.append(error)
+            return
 
-                # Detect marker blocks
-                blocks = self.marker_detector.detect_blocks(content, str(file_path))
+        result.validation_issues.extend(issues)
+        result.files_scanned += 1
 
-                # Store blocks for this file
-                result.file_blocks[str(file_path)] = blocks
-                result.blocks_found += len(blocks)
-                result.files_scanned += 1
+        if blocks is None:
+            # Don't process this file - has validation errors
+            logger.warning(f"Skipping {file_path} due to validation errors")
+            return
 
+        # Store blocks for this file
+        result.file_blocks[file_path] = blocks
+        result.blocks_found += len(blocks)
+
+    def _scan_files(self, files: List[Path]) -> List[Tuple[str, list, Optional[list], Optional[str]]]:
+        """
+        Scan files, in a process pool when enabled and worthwhile.
+
+        Marker validation and detection are CPU-bound pure Python, so
+        separate processes (not threads) are needed to use several cores.
+        Small scans stay serial, and any pool failure (e.g. platforms
+        without working multiprocessing) falls back to serial scanning.
+
+        Args:
+            files: Files to scan
+
+        Returns:
+            scan_file_content results in the same order as files
+        """
+        file_paths = [str(file_path) for file_path in files]
+        scanning = self.config.scanning
+        workers = scanning.workers or os.cpu_count() or 1
+
+        if scanning.parallel and workers > 1 and len(file_paths) > PARALLEL_SCAN_MIN_FILES:
+            try:
+                # Workers get this scanner's config (pickled once per process)
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_scan_worker,
+                                         initargs=(self.config,)) as executor:
+                    chunksize = max(1, len(file_paths) // (workers * 4))
+                    return list(executor.map(_scan_file_worker, file_paths, chunksize=chunksize))
             except Exception as e:
-                error_msg = f"Error scanning {file_path}: {str(e)}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
+                logger.warning(f"Parallel scan failed ({e}) - scanning serially")
 
-        return result
+        return [self.scan_file_content(file_path) for file_path in file_paths]
+
+    def scan_file_content(self, file_path: str) -> Tuple[str, list, Optional[list], Optional[str]]:
+        """
+        Validate and detect markers in one file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            (file_path, validation_issues, blocks, error) - blocks is None if
+            the file has validation errors, error is set if it can't be scanned
+        """
+        try:
+            # Read raw bytes: most files have no markers and are done here
+            data = self._read_if_marked(file_path)
+            if data is None:
+                return file_path, [], [], None
+
+            # Same text as reading in text mode (universal newlines)
+            content = data.decode('utf-8')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+            # Validate markers first
+            issues = self.validator.validate_file(content, file_path)
+
+            # Check if there are any errors
+            if self.validator.has_errors(issues):
+                return file_path, issues, None, None
+
+            # Detect marker blocks
+            blocks = self.marker_detector.detect_blocks(content, file_path)
+            return file_path, issues, blocks, None
+
+        except Exception as e:
+            return file_path, [], None, f"Error scanning {file_path}: {str(e)}"
+
+    @staticmethod
+    def _read_if_marked(file_path: str) -> Optional[bytes]:
+        """
+        Read a file's bytes if it contains a marker.
+
+        The file is searched in READ_CHUNK_BYTES chunks and only read in
+        full once the marker prefix shows up, so a large file without
+        markers never holds more than one chunk in memory.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Full file content, or None if it contains no marker
+        """
+        overlap = len(MARKER_PREFIX_BYTES) - 1
+        with open(file_path, 'rb') as f:
+            tail = b''
+            while True:
+                chunk = f.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    return None
+                if MARKER_PREFIX_BYTES in tail + chunk:
+                    break
+                tail = chunk[-overlap:]
+
+            # Files smaller than one chunk are already read in full
+            if not tail and len(chunk) < READ_CHUNK_BYTES:
+                return chunk
+
+            f.seek(0)
+            return f.read()
 
     def _collect_files(self, paths: List[str]) -> List[Path]:
         """
@@ -112,7 +227,7 @@ class Scanner:
             List of file paths to scan
         """
         files = []
-        exclude_patterns = set(self.config.scanning.exclude)
+        exclude_regex = self._compile_excludes(self.config.scanning.exclude)
         file_types = {".py"}  # Always Python files
 
         for path_str in paths:
@@ -122,48 +237,86 @@ class Scanner:
                 continue
 
             if path.is_file():
-                if self._should_include_file(path, file_types, exclude_patterns):
+                if self._should_include_file(path, file_types, exclude_regex):
                     files.append(path)
             elif path.is_dir():
-                files.extend(self._scan_directory(path, file_types, exclude_patterns))
+                files.extend(self._scan_directory(path, file_types, exclude_regex))
 
         return files
 
     def _scan_directory(self, directory: Path, file_types: Set[str],
-                       exclude_patterns: Set[str]) -> List[Path]:
+                       exclude_regex: Optional[Pattern]) -> List[Path]:
         """
         Recursively scan directory for files.
 
         Args:
             directory: Directory to scan
             file_types: Set of file extensions to include
-            exclude_patterns: Set of patterns to exclude
+            exclude_regex: Compiled exclude patterns (see _compile_excludes)
 
         Returns:
             List of file paths
         """
-        files = []
+        return list(self._iter_directory(str(directory), file_types, exclude_regex))
 
-        for root, dirs, filenames in os.walk(directory):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if not self._matches_exclude(d, exclude_patterns)]
+    def _iter_directory(self, directory: str, file_types: Set[str],
+                        exclude_regex: Optional[Pattern]) -> Iterator[Path]:
+        """
+        Yield matching files under a directory, top-down like os.walk.
 
-            for filename in filenames:
-                file_path = Path(root) / filename
-                if self._should_include_file(file_path, file_types, exclude_patterns):
-                    files.append(file_path)
+        Uses os.scandir so file type checks come from the directory listing
+        (DirEntry caches them) instead of extra stat calls per entry.
+        Symlinked directories are listed but not followed.
 
-        return files
+        Args:
+            directory: Directory to scan
+            file_types: Set of file extensions to include
+            exclude_regex: Compiled exclude patterns (see _compile_excludes)
+
+        Yields:
+            File paths in os.walk order (files first, then subdirectories)
+        """
+        # Size comes from the DirEntry, so oversized files are never opened
+        max_size = self.config.scanning.max_file_size_mb * 1024 * 1024
+        subdirs = []
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            # Filter out excluded directories
+                            if (not entry.is_symlink()
+                                    and not self._matches_exclude(entry.name, exclude_regex)):
+                                subdirs.append(entry.path)
+                            continue
+
+                        if os.path.splitext(entry.name)[1] not in file_types:
+                            continue
+                        if self._matches_exclude(entry.path, exclude_regex):
+                            continue
+                        if entry.stat().st_size > max_size:
+                            continue
+                    except OSError:
+                        continue  # Entry vanished or is unreadable
+
+                    yield Path(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot list directory {directory}: {e}")
+            return
+
+        for subdir in subdirs:
+            yield from self._iter_directory(subdir, file_types, exclude_regex)
 
     def _should_include_file(self, file_path: Path, file_types: Set[str],
-                            exclude_patterns: Set[str]) -> bool:
+                            exclude_regex: Optional[Pattern]) -> bool:
         """
         Check if file should be included in scan.
 
         Args:
             file_path: File path to check
             file_types: Set of allowed file extensions
-            exclude_patterns: Set of patterns to exclude
+            exclude_regex: Compiled exclude patterns (see _compile_excludes)
 
         Returns:
             True if file should be included
@@ -173,7 +326,7 @@ class Scanner:
             return False
 
         # Check exclude patterns
-        if self._matches_exclude(str(file_path), exclude_patterns):
+        if self._matches_exclude(str(file_path), exclude_regex):
             return False
 
         # Check file size
@@ -183,30 +336,73 @@ class Scanner:
 
         return True
 
-    def _matches_exclude(self, path: str, exclude_patterns: Set[str]) -> bool:
+    @staticmethod
+    def _compile_excludes(exclude_patterns: List[str]) -> Optional[Pattern]:
+        """
+        Compile exclude patterns into a single regex.
+
+        A path is excluded if it matches a pattern as a glob (fnmatch) or
+        contains it as a substring, mirroring the per-pattern checks that
+        used to run for every path.
+
+        Args:
+            exclude_patterns: Glob/substring patterns from config
+
+        Returns:
+            Compiled regex, or None if there are no patterns
+        """
+        alternatives = []
+        for pattern in dict.fromkeys(exclude_patterns):
+            pattern = os.path.normcase(pattern)
+            alternatives.append(translate(pattern))
+            alternatives.append(f"(?s:.*{re.escape(pattern)})")
+
+        if not alternatives:
+            return None
+        return re.compile("|".join(alternatives))
+
+    @staticmethod
+    def _matches_exclude(path: str, exclude_regex: Optional[Pattern]) -> bool:
         """
         Check if path matches any exclude pattern.
 
         Args:
             path: Path to check
-            exclude_patterns: Set of exclude patterns
+            exclude_regex: Compiled exclude patterns (see _compile_excludes)
 
         Returns:
             True if path should be excluded
         """
-        for pattern in exclude_patterns:
-            if fnmatch(path, pattern) or pattern in path:
-                return True
-        return False
+        return bool(exclude_regex and exclude_regex.match(os.path.normcase(path)))
 
     def scan_file(self, file_path: str) -> ScanResult:
         """
         Scan a single file.
 
+        The file is scanned directly, without the file collection step
+        (directory walk, type/exclude/size filters) used by scan().
+
         Args:
             file_path: Path to the file to scan
 
         Returns:
             ScanResult with marker blocks
         """
-        return self.scan(paths=[file_path])
+        result = ScanResult()
+        self._add_file_result(result, *self.scan_file_content(str(file_path)))
+        return result
+
+
+# Scanner for the current worker process (set up by the pool initializer)
+_worker_scanner: Optional[Scanner] = None
+
+
+def _init_scan_worker(config: Config):
+    """Process-pool initializer: build the worker's Scanner from the caller's config."""
+    global _worker_scanner
+    _worker_scanner = Scanner(config)
+
+
+def _scan_file_worker(file_path: str) -> Tuple[str, list, Optional[list], Optional[str]]:
+    """Process-pool entry point for Scanner.scan_file_content."""
+    return _worker_scanner.scan_file_content(file_path)
@@ -58,7 +58,7 @@ class ASTAnalyzer:
             return ModuleInfo(
                 module_path=str(file_path),
                 module_name=module_name,
-                lines_of_code=len(content.split('\n'))
+                lines_of_code=content.count('\n') + 1
             )
         # @llm-comm-end
 
@@ -131,7 +131,7 @@ class ASTAnalyzer:
         # @llm-comm-end
 
         # @llm-comm-start
-        lines_of_code = len(content.split('\n'))
+        lines_of_code = content.count('\n') + 1
         # @llm-comm-end
 
         # @llm-comm-start
@@ -266,7 +266,7 @@ class ASTAnalyzer:
         # @llm-comm-start
         num_functions = sum(1 for node in ast.walk(tree) if isinstance(node, ast.FunctionDef))
         num_classes = sum(1 for node in ast.walk(tree) if isinstance(node, ast.ClassDef))
-        lines_of_code = len(content.split('\n'))
+        lines_of_code = content.count('\n') + 1
         # @llm-comm-end
 
         has_tests = 'test' in file_path.name.lower() or 'tests' in str(file_path).lower()
@@ -67,20 +67,21 @@ class ContentHasher:
         return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
 
     @staticmethod
-    def calculate_file_hash(file_path: str) -> CodeHash:
+    def calculate_file_hash(file_path: str, content: Optional[str] = None) -> CodeHash:
         """
         Calculate hash for entire file.
 
         Args:
             file_path: Path to file
+            content: File content if already in memory (skips re-reading)
 
         Returns:
             CodeHash for the file
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
 
-        lines = content.split('\n')
         content_hash = ContentHasher.calculate_hash(content)
 
         return CodeHash(
@@ -88,7 +89,7 @@ class ContentHasher:
             scope_name=file_path,
             content_hash=content_hash,
             line_start=1,
-            line_end=len(lines)
+            line_end=content.count('\n') + 1  # Same as len(content.split('\n'))
         )
 
     @staticmethod
@@ -140,13 +141,15 @@ class ContentHasher:
         return hashes
 
     @staticmethod
-    def calculate_all_hashes(file_path: str, blocks: List) -> Dict[str, List[CodeHash]]:
+    def calculate_all_hashes(file_path: str, blocks: List,
+                             content: Optional[str] = None) -> Dict[str, List[CodeHash]]:
         """
         Calculate all hierarchical hashes in a single pass.
 
         Args:
             file_path: Path to file
             blocks: List of DetectedBlock objects
+            content: File content if already in memory (skips re-reading)
 
         Returns:
             Dict with keys 'file', 'modules', 'classes', 'methods', 'comments' containing CodeHash lists
@@ -160,7 +163,7 @@ class ContentHasher:
         }
 
         # File-level hash
-        file_hash = ContentHasher.calculate_file_hash(file_path)
+        file_hash = ContentHasher.calculate_file_hash(file_path, content)
         result['file'].append(file_hash)
 
         # Block-level hashes
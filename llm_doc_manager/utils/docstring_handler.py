@@ -5,34 +5,70 @@ Provides functions for extracting and manipulating docstrings
 to avoid code duplication between modules.
 """
 
+import ast
 import re
+import textwrap
 from typing import Optional, Tuple
 
+# Docstring pattern, compiled once at import: group 1 for """, group 2 for '''
+DOCSTRING_PATTERN = re.compile(r'"""(.*?)"""|\'\'\'(.*?)\'\'\'', re.DOTALL)
+
+# Definitions whose docstring is looked up after the module docstring
+DEFINITION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
 
 def extract_docstring(code: str) -> Optional[str]:
     """
     Extract docstring from Python code.
 
-    Handles both triple-double-quote and triple-single-quote docstrings.
+    Uses the Python parser, so quotes inside strings, escaped quotes and
+    string literals that are not docstrings are handled correctly. The
+    module docstring is returned if present, otherwise the docstring of
+    the first top-level function or class (code blocks may be indented
+    methods). Falls back to the first triple-quoted string when the code
+    is a partial snippet that does not parse.
 
     Args:
         code (str): Python code containing potential docstring
 
     Returns:
-        Optional[str]: Extracted docstring content (without quotes), or None if no
-        docstring found
+        Optional[str]: Extracted docstring content (without quotes, cleaned
+        like inspect.cleandoc), or None if no docstring found
+    """
+    # Fast path: most code without a docstring has no triple quotes at all
+    if '"""' not in code and "'''" not in code:
+        return None
+
+    try:
+        tree = ast.parse(textwrap.dedent(code))
+    except (SyntaxError, ValueError):
+        return _extract_docstring_regex(code)
+
+    docstring = ast.get_docstring(tree, clean=True)
+    if docstring is None:
+        for node in tree.body:
+            if isinstance(node, DEFINITION_NODES):
+                docstring = ast.get_docstring(node, clean=True)
+                break
+
+    return docstring
+
+
+def _extract_docstring_regex(code: str) -> Optional[str]:
+    """
+    Extract the first triple-quoted string from code that does not parse.
+
+    Args:
+        code (str): Python code snippet
+
+    Returns:
+        Optional[str]: Content of the first triple-quoted string, or None
     """
-    # Match both """ and ''' docstrings
-    # Pattern: captures content between triple quotes
-    patterns = [
-        r'"""(.*?)"""',  # Triple double quotes
-        r"'''(.*?)'''",  # Triple single quotes
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, code, re.DOTALL)
-        if match:
-            return match.group(1).strip()
+    # Single scan for whichever triple-quote delimiter comes first
+    match = DOCSTRING_PATTERN.search(code)
+    if match:
+        content = match.group(1)
+        return (content if content is not None else match.group(2)).strip()
 
     return None
 
@@ -58,21 +94,27 @@ def find_docstring_location(lines: list, start_idx: int) -> Tuple[Optional[int],
     quote_type = None
 
     for i in range(start_idx, len(lines)):  # Search until end of file (no arbitrary limit)
-        line = lines[i].strip()
+        # Substring checks don't depend on surrounding whitespace, so the raw
+        # line is used and only stripped when its first character matters
+        line = lines[i]
 
         # Stop if we hit an END marker (end of current block)
-        if line.startswith('# @llm-') and '-end' in line:
+        if '-end' in line and line.lstrip().startswith('# @llm-'):
             break
 
-        # Check for triple quotes
-        if '"""' in line or "'''" in line:
+        # Check for triple quotes (each search done once)
+        double_at = line.find('"""')
+        if double_at != -1 or "'''" in line:
             if docstring_start is None:
                 # Found opening
                 docstring_start = i
-                quote_type = '"""' if '"""' in line else "'''"
+                if double_at != -1:
+                    quote_type, opening_at = '"""', double_at
+                else:
+                    quote_type, opening_at = "'''", line.find("'''")
 
-                # Check if it's a one-liner docstring
-                if line.count(quote_type) >= 2:
+                # One-liner if the closing quotes follow on the same line
+                if line.find(quote_type, opening_at + 3) != -1:
                     docstring_end = i
                     break
             else:
@@ -80,10 +122,12 @@ def find_docstring_location(lines: list, start_idx: int) -> Tuple[Optional[int],
                 if quote_type in line:
                     docstring_end = i
                     break
-        elif docstring_start is None and line and not line.startswith('#'):
-            # Found non-comment, non-empty line before docstring
-            # This means there's no docstring in this location
-            break
+        elif docstring_start is None:
+            stripped = line.strip()
+            if stripped and not stripped.startswith('#'):
+                # Found non-comment, non-empty line before docstring
+                # This means there's no docstring in this location
+                break
 
     if docstring_start is not None and docstring_end is not None:
         return (docstring_start, docstring_end)
@@ -6,29 +6,109 @@ client selection via Factory pattern.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Type
+import importlib.util
+import json
+from typing import Dict, List, Optional, Tuple, Type
 import logging
+import threading
+import time
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
 
+class RateLimiter:
+    """Thread-safe limiter keeping calls under `rpm` requests and `tpm` tokens per minute."""
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        """
+        Initialize limiter.
+
+        Args:
+            rpm: Maximum requests per minute (None or 0 disables the limit)
+            tpm: Maximum tokens per minute (None or 0 disables the limit)
+        """
+        self.interval = 60.0 / rpm if rpm else 0.0
+        self.seconds_per_token = 60.0 / tpm if tpm else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._next_token_slot = 0.0
+
+    def acquire(self, tokens: int = 0):
+        """
+        Block until the caller may send the next request.
+
+        Args:
+            tokens: Estimated tokens the request will use (prompt + completion)
+        """
+        if not self.interval and not self.seconds_per_token:
+            return
+
+        # Reserve the next free slot under the lock, sleep outside it. A
+        # request's tokens push back the earliest start of the next one.
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot, self._next_token_slot)
+            self._next_slot = slot + self.interval
+            self._next_token_slot = slot + tokens * self.seconds_per_token
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def create_http2_client():
+    """
+    Create a pooled HTTP/2 httpx client for provider SDKs, if possible.
+
+    With HTTP/2, concurrent requests from the worker threads are
+    multiplexed over one kept-alive TLS connection instead of opening a
+    connection each. Requires the optional 'h2' package
+    (pip install llm-doc-manager[http2]).
+
+    Returns:
+        httpx.Client, or None to let the SDK use its default HTTP/1.1 pool
+    """
+    # HTTP/2 support only needs to be installed, not imported here
+    if importlib.util.find_spec("h2") is None:
+        return None
+
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+
+
 class BaseLLMClient(ABC):
     """Base class for all LLM clients."""
 
+    # Whether call() enforces json_schema (Structured Outputs)
+    supports_structured_outputs = False
+
+    # Whether submit_batch()/retrieve_batch() are available (offline Batch API)
+    supports_batch = False
+
     def __init__(
         self,
         model: str,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         temperature: float = 0.5,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None
     ):
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.timeout = timeout  # Seconds per request (None = SDK default)
+        self.max_retries = max_retries  # SDK retries on 429/5xx (None = SDK default)
 
         # Inicializa o cliente específico
         self.client = self._init_client()
@@ -44,7 +124,8 @@ class BaseLLMClient(ABC):
         prompt: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        json_schema: Optional[Type[BaseModel]] = None
+        json_schema: Optional[Type[BaseModel]] = None,
+        system: Optional[str] = None
     ) -> Tuple[str, int]:
         """
         Execute LLM call.
@@ -54,23 +135,73 @@ class BaseLLMClient(ABC):
             temperature: Sobrescreve preset (opcional)
             max_tokens: Sobrescreve preset (opcional)
             json_schema: Pydantic schema for structured outputs (OpenAI only)
+            system: Instructions shared by many calls, sent as the system
+                message so provider prompt caching can reuse the prefix
 
         Returns:
             Tuple[str, int]: (resposta_texto, total_tokens)
         """
         pass
 
+    def _sdk_client_kwargs(self) -> Dict:
+        """Build the constructor arguments shared by the OpenAI and Anthropic SDKs."""
+        # One client (and connection pool) per LLM client, reused by every call
+        kwargs = {"api_key": self.api_key, "http_client": create_http2_client()}
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        if self.timeout is not None:
+            kwargs["timeout"] = self.timeout
+        if self.max_retries is not None:
+            kwargs["max_retries"] = self.max_retries
+        return kwargs
+
+    @staticmethod
+    def _build_messages(prompt: str, system: Optional[str] = None) -> List[Dict[str, str]]:
+        """Build a chat message list with an optional leading system message."""
+        messages = [{"role": "system", "content": system}] if system else []
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def submit_batch(
+        self,
+        requests: List[Tuple[str, str, Optional[Type[BaseModel]]]]
+    ) -> str:
+        """
+        Submit prompts as one offline batch job.
+
+        Args:
+            requests: (custom_id, prompt, json_schema) per request
+
+        Returns:
+            str: Provider batch job ID
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch jobs")
+
+    def retrieve_batch(self, batch_id: str) -> Tuple[str, Optional[Dict[str, Tuple[str, int]]]]:
+        """
+        Fetch the state of a batch job and its results once finished.
+
+        Args:
+            batch_id: Provider batch job ID
+
+        Returns:
+            Tuple[str, Optional[Dict]]: (status, {custom_id: (resposta_texto, tokens)});
+            results are None while the job is still running
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch jobs")
+
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI LLM client."""
 
+    supports_structured_outputs = True
+    supports_batch = True
+
     def _init_client(self):
         """Initialize OpenAI client."""
         try:
             import openai
-            if self.base_url:
-                return openai.OpenAI(api_key=self.api_key, base_url=self.base_url)
-            return openai.OpenAI(api_key=self.api_key)
+            return openai.OpenAI(**self._sdk_client_kwargs())
         except ImportError:
             raise ImportError("openai package not installed. Run: pip install openai")
 
@@ -79,7 +210,8 @@ class OpenAIClient(BaseLLMClient):
         prompt: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        json_schema: Optional[Type[BaseModel]] = None
+        json_schema: Optional[Type[BaseModel]] = None,
+        system: Optional[str] = None
     ) -> Tuple[str, int]:
         temp = temperature if temperature is not None else self.temperature
         max_tok = max_tokens if max_tokens is not None else self.max_tokens
@@ -89,7 +221,7 @@ class OpenAIClient(BaseLLMClient):
                 # Use Structured Outputs with Pydantic schema
                 response = self.client.beta.chat.completions.parse(
                     model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=self._build_messages(prompt, system),
                     temperature=temp,
                     max_tokens=max_tok,
                     response_format=json_schema
@@ -102,7 +234,7 @@ class OpenAIClient(BaseLLMClient):
                 # Normal call (fallback)
                 response = self.client.chat.completions.create(
                     model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=self._build_messages(prompt, system),
                     temperature=temp,
                     max_tokens=max_tok
                 )
@@ -112,17 +244,89 @@ class OpenAIClient(BaseLLMClient):
             logger.error(f"Erro ao chamar OpenAI API: {e}")
             raise
 
+    # Batch job states after which no more results will arrive
+    BATCH_FINAL_STATES = ('completed', 'failed', 'expired', 'cancelled')
+
+    def submit_batch(
+        self,
+        requests: List[Tuple[str, str, Optional[Type[BaseModel]]]]
+    ) -> str:
+        lines = []
+        for custom_id, prompt, json_schema in requests:
+            body = {
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+            }
+            if json_schema:
+                body["response_format"] = {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": json_schema.__name__,
+                        "schema": json_schema.model_json_schema(),
+                    },
+                }
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }))
+
+        try:
+            # Upload the JSONL from memory - no temporary file needed
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            return batch.id
+        except Exception as e:
+            logger.error(f"Erro ao criar batch na OpenAI API: {e}")
+            raise
+
+    def retrieve_batch(self, batch_id: str) -> Tuple[str, Optional[Dict[str, Tuple[str, int]]]]:
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status not in self.BATCH_FINAL_STATES:
+                return batch.status, None
+
+            results = {}
+            if batch.output_file_id:
+                output = self.client.files.content(batch.output_file_id).text
+                for line in output.splitlines():
+                    if not line.strip():
+                        continue
+                    item = json.loads(line)
+                    response = item.get("response") or {}
+                    if response.get("status_code") != 200:
+                        continue
+                    body = response["body"]
+                    results[item["custom_id"]] = (
+                        body["choices"][0]["message"]["content"],
+                        body.get("usage", {}).get("total_tokens", 0)
+                    )
+            return batch.status, results
+        except Exception as e:
+            logger.error(f"Erro ao consultar batch na OpenAI API: {e}")
+            raise
+
 
 class AnthropicClient(BaseLLMClient):
     """Anthropic LLM client."""
 
+    supports_batch = True
+
     def _init_client(self):
         """Initialize Anthropic client."""
         try:
             import anthropic
-            if self.base_url:
-                return anthropic.Anthropic(api_key=self.api_key, base_url=self.base_url)
-            return anthropic.Anthropic(api_key=self.api_key)
+            return anthropic.Anthropic(**self._sdk_client_kwargs())
         except ImportError:
             raise ImportError("anthropic package not installed. Run: pip install anthropic")
 
@@ -131,18 +335,31 @@ class AnthropicClient(BaseLLMClient):
         prompt: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        json_schema: Optional[Type[BaseModel]] = None
+        json_schema: Optional[Type[BaseModel]] = None,
+        system: Optional[str] = None
     ) -> Tuple[str, int]:
         temp = temperature if temperature is not None else self.temperature
         max_tok = max_tokens if max_tokens is not None else self.max_tokens
 
         # Note: Anthropic doesn't support Structured Outputs (json_schema ignored)
+        kwargs = {}
+        if system:
+            # Explicit prompt caching: the shared instructions are billed at
+            # the cached rate on later calls (prefixes below the provider's
+            # minimum cacheable length are simply not cached)
+            kwargs["system"] = [{
+                "type": "text",
+                "text": system,
+                "cache_control": {"type": "ephemeral"}
+            }]
+
         try:
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=max_tok,
                 temperature=temp,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs
             )
             tokens = response.usage.input_tokens + response.usage.output_tokens
             return response.content[0].text, tokens
@@ -150,6 +367,51 @@ class AnthropicClient(BaseLLMClient):
             logger.error(f"Erro ao chamar Anthropic API: {e}")
             raise
 
+    def submit_batch(
+        self,
+        requests: List[Tuple[str, str, Optional[Type[BaseModel]]]]
+    ) -> str:
+        # Message Batches API: params are the same as for messages.create
+        batch_requests = [
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": self.model,
+                    "max_tokens": self.max_tokens,
+                    "temperature": self.temperature,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            }
+            for custom_id, prompt, _ in requests
+        ]
+
+        try:
+            batch = self.client.messages.batches.create(requests=batch_requests)
+            return batch.id
+        except Exception as e:
+            logger.error(f"Erro ao criar batch na Anthropic API: {e}")
+            raise
+
+    def retrieve_batch(self, batch_id: str) -> Tuple[str, Optional[Dict[str, Tuple[str, int]]]]:
+        try:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status != 'ended':
+                return batch.processing_status, None
+
+            results = {}
+            for entry in self.client.messages.batches.results(batch_id):
+                if entry.result.type != 'succeeded':
+                    continue
+                message = entry.result.message
+                results[entry.custom_id] = (
+                    message.content[0].text,
+                    message.usage.input_tokens + message.usage.output_tokens
+                )
+            return batch.processing_status, results
+        except Exception as e:
+            logger.error(f"Erro ao consultar batch na Anthropic API: {e}")
+            raise
+
 
 class OllamaClient(BaseLLMClient):
     """Ollama LLM client (local)."""
@@ -158,7 +420,11 @@ class OllamaClient(BaseLLMClient):
         """Initialize Ollama client."""
         try:
             import ollama
-            return ollama.Client(host=self.base_url) if self.base_url else ollama.Client()
+            # Extra arguments are passed through to the underlying httpx client
+            kwargs = {"timeout": self.timeout} if self.timeout is not None else {}
+            if self.base_url:
+                return ollama.Client(host=self.base_url, **kwargs)
+            return ollama.Client(**kwargs)
         except ImportError:
             raise ImportError("ollama package not installed. Run: pip install ollama")
 
@@ -167,14 +433,18 @@ class OllamaClient(BaseLLMClient):
         prompt: str,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        json_schema: Optional[Type[BaseModel]] = None
+        json_schema: Optional[Type[BaseModel]] = None,
+        system: Optional[str] = None
     ) -> Tuple[str, int]:
+        max_tok = max_tokens if max_tokens is not None else self.max_tokens
+
         # Note: Ollama doesn't support Structured Outputs (json_schema ignored)
         # Ollama não reporta tokens
         try:
             response = self.client.chat(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}]
+                messages=self._build_messages(prompt, system),
+                options={"num_predict": max_tok}
             )
             return response['message']['content'], 0
         except Exception as e:
@@ -199,7 +469,9 @@ class LLMClientFactory:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         temperature: float = 0.5,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None
     ) -> BaseLLMClient:
         """
         Create LLM client based on provider.
@@ -211,6 +483,8 @@ class LLMClientFactory:
             base_url: URL base customizada (opcional)
             temperature: Temperature para geração (padrão: 0.5)
             max_tokens: Máximo de tokens para resposta (padrão: 4000)
+            timeout: Timeout por requisição em segundos (padrão: SDK)
+            max_retries: Tentativas em erros 429/5xx (padrão: SDK; ignorado pelo Ollama)
 
         Returns:
             BaseLLMClient: Instância do cliente apropriado
@@ -229,5 +503,7 @@ class LLMClientFactory:
             api_key=api_key,
             base_url=base_url,
             temperature=temperature,
-            max_tokens=max_tokens
-        )
\ No newline at end of file
+            max_tokens=max_tokens,
+            timeout=timeout,
+            max_retries=max_retries
+        )
@@ -6,6 +6,7 @@ Provides a simple, consistent logging interface across all modules.
 
 import logging
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +16,7 @@ class LoggerManager:
 
     _initialized = False
     _log_file = None
+    _init_lock = threading.Lock()  # Worker threads may race into setup_logging
 
     @classmethod
     def setup_logging(cls, log_file: Optional[str] = None, level: str = "INFO", console: bool = False):
@@ -29,6 +31,21 @@ class LoggerManager:
         if cls._initialized:
             return
 
+        with cls._init_lock:
+            # Another thread may have finished setup while we waited
+            if not cls._initialized:
+                cls._configure(log_file, level, console)
+
+    @classmethod
+    def _configure(cls, log_file: Optional[str], level: str, console: bool):
+        """
+        Install the handlers. Called once, while holding _init_lock.
+
+        Args:
+            log_file (Optional[str]): Path to log file. If None, uses default location.
+            level (str): Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            console (bool): Enable console logging
+        """
         # Convert string level to logging constant
         numeric_level = getattr(logging, level.upper(), logging.INFO)
 
@@ -22,10 +22,31 @@ Line Number Convention:
 
 import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Match, Optional, Tuple
 from enum import Enum
 
 from .docstring_handler import find_docstring_location
+from .text_normalizer import strip_triple_quotes
+
+# Marker patterns are simple anchored alternations - use the linear-time
+# RE2 engine when google-re2 is installed, stdlib re otherwise
+try:
+    import re2 as marker_re
+except ImportError:
+    marker_re = re
+
+# Name extraction from definition lines, compiled once at import
+FUNCTION_NAME_PATTERN = re.compile(r'(?:async\s+)?def\s+(\w+)')
+CLASS_NAME_PATTERN = re.compile(r'class\s+(\w+)')
+
+# Docstrings containing any of these are treated as missing. Plain substring
+# tests: faster than one alternation regex on docstrings past ~100 chars
+PLACEHOLDER_KEYWORDS = (
+    'to_do', 'todo', 'fixme', 'to do',
+    'to_review', 'to review', 'placeholder',
+    'add description', 'description here'
+)
+
 # TaskPriority removed - using TASK_PROCESSING_ORDER for deterministic ordering
 
 
@@ -59,6 +80,29 @@ class MarkerPatterns:
     COMM_START = r"^\s*#\s*@llm-comm-start\s*$"
     COMM_END = r"^\s*#\s*@llm-comm-end\s*$"
 
+    # Union of all start/end patterns above (one match call per line)
+    ANY_MARKER = r"^\s*#\s*@llm-(?:module|doc|class|comm)-(?:start|end)\s*$"
+    ANY_MARKER_RE = marker_re.compile(ANY_MARKER)
+
+    # Same markers over a whole buffer: [^\S\n] keeps matches on one line
+    # (inline (?m) flag works with both re and re2)
+    MARKER_EVENTS_RE = marker_re.compile(
+        r"(?m)^[^\S\n]*#[^\S\n]*@llm-(module|doc|class|comm)-(start|end)[^\S\n]*$"
+    )
+    _TAG_TO_TYPE = {
+        'module': MarkerType.MODULE_DOC,
+        'doc': MarkerType.DOCSTRING,
+        'class': MarkerType.CLASS_DOC,
+        'comm': MarkerType.COMMENT,
+    }
+
+    # Marker text after '#' -> (MarkerType, 'start' | 'end'), for match_line
+    _LITERALS = {
+        f'@llm-{tag}-{edge}': (marker_type, edge)
+        for tag, marker_type in _TAG_TO_TYPE.items()
+        for edge in ('start', 'end')
+    }
+
     # Cached compiled patterns
     _compiled_patterns = None
 
@@ -72,28 +116,88 @@ class MarkerPatterns:
         if cls._compiled_patterns is None:
             cls._compiled_patterns = {
                 MarkerType.MODULE_DOC: {
-                    'start': re.compile(cls.MODULE_START),
-                    'end': re.compile(cls.MODULE_END)
+                    'start': marker_re.compile(cls.MODULE_START),
+                    'end': marker_re.compile(cls.MODULE_END)
                 },
                 MarkerType.DOCSTRING: {
-                    'start': re.compile(cls.DOC_START),
-                    'end': re.compile(cls.DOC_END)
+                    'start': marker_re.compile(cls.DOC_START),
+                    'end': marker_re.compile(cls.DOC_END)
                 },
                 MarkerType.CLASS_DOC: {
-                    'start': re.compile(cls.CLASS_START),
-                    'end': re.compile(cls.CLASS_END)
+                    'start': marker_re.compile(cls.CLASS_START),
+                    'end': marker_re.compile(cls.CLASS_END)
                 },
                 MarkerType.COMMENT: {
-                    'start': re.compile(cls.COMM_START),
-                    'end': re.compile(cls.COMM_END)
+                    'start': marker_re.compile(cls.COMM_START),
+                    'end': marker_re.compile(cls.COMM_END)
                 }
             }
         return cls._compiled_patterns
 
+    @classmethod
+    def match_line(cls, line: str) -> Optional[Tuple[MarkerType, str]]:
+        """Classify a single line with plain string operations, no regex.
+
+        Equivalent to matching every start/end pattern: str.strip() and
+        the patterns' \\s agree on what counts as whitespace, so only the
+        text between '#' and the end of the line has to be looked up.
+
+        Args:
+            line: One line of code
+
+        Returns:
+            (MarkerType, 'start' | 'end') for marker lines, None otherwise
+        """
+        stripped = line.strip()
+        if not stripped.startswith('#'):
+            return None
+        return cls._LITERALS.get(stripped[1:].lstrip())
+
+    @classmethod
+    def find_markers(cls, content: str) -> List[Tuple[int, MarkerType, str]]:
+        """Find every marker line in one regex pass over the whole content.
+
+        Args:
+            content: Full file content
+
+        Returns:
+            List of (EXTERNAL 1-indexed line, MarkerType, 'start' | 'end')
+            in file order
+        """
+        return [(line_number, marker_type, edge)
+                for line_number, marker_type, edge, _ in cls.iter_markers(content)]
+
+    @classmethod
+    def iter_markers(cls, content: str) -> Iterator[Tuple[int, MarkerType, str, Match]]:
+        """Yield every marker line with its regex match, in file order.
+
+        Line numbers are counted incrementally between matches, so the
+        content is never split into lines.
+
+        Args:
+            content: Full file content
+
+        Yields:
+            (EXTERNAL 1-indexed line, MarkerType, 'start' | 'end', match);
+            match.start()/match.end() delimit the marker line (without '\n')
+        """
+        line_number = 1
+        last_pos = 0
+
+        for match in cls.MARKER_EVENTS_RE.finditer(content):
+            line_number += content.count('\n', last_pos, match.start())
+            last_pos = match.start()
+            yield line_number, cls._TAG_TO_TYPE[match.group(1)], match.group(2), match
+
 
 @dataclass
 class DetectedBlock:
     """Represents a detected documentation block."""
+    # One instance per marker block - no per-instance __dict__
+    # (dataclass(slots=True) needs Python 3.10, setup.py allows 3.8)
+    __slots__ = ('file_path', 'start_line', 'end_line', 'full_code', 'has_docstring',
+                 'current_docstring', 'function_name', 'marker_type')
+
     file_path: str
     start_line: int
     end_line: int
@@ -128,74 +232,66 @@ class MarkerDetector:
         Returns:
             List of detected blocks with their details
         """
-        blocks = []
-        lines = content.split('\n')
-
-        i = 0
-        while i < len(lines):
-            # Check which type of marker this is
-            marker_type = None
-            for mtype, patterns in self.patterns.items():
-                if patterns['start'].match(lines[i]):
-                    marker_type = mtype
-                    break
-
-            if marker_type:
-                start_line = i + 1  # 1-indexed
-
-                # Find corresponding end marker with nesting support
-                end_line = None
-                start_pattern = self.patterns[marker_type]['start']
-                end_pattern = self.patterns[marker_type]['end']
-                depth = 1  # We're inside one marker already
-
-                for j in range(i + 1, len(lines)):
-                    # Check for nested start markers of the same type
-                    if start_pattern.match(lines[j]):
-                        depth += 1
-                    elif end_pattern.match(lines[j]):
-                        depth -= 1
-                        if depth == 0:
-                            # Found the matching end marker
-                            end_line = j + 1  # 1-indexed
-                            break
-
-                if end_line is None:
-                    # No matching end marker - skip this start marker
-                    i += 1
-                    continue
-
-                # Extract code block (everything between markers)
-                block_lines = lines[i + 1:end_line - 1]  # Exclude marker lines
-                full_code = '\n'.join(block_lines)
-
-                # Analyze the block based on marker type
-                if marker_type == MarkerType.MODULE_DOC:
-                    analysis = self._analyze_module_block(block_lines, file_path)
-                elif marker_type == MarkerType.DOCSTRING:
-                    analysis = self._analyze_block(block_lines)
-                elif marker_type == MarkerType.CLASS_DOC:
-                    analysis = self._analyze_class_block(block_lines)
-                else:  # MarkerType.COMMENT
-                    analysis = self._analyze_comment_block(block_lines, start_line)
-
-                blocks.append(DetectedBlock(
-                    file_path=file_path,
-                    start_line=start_line,
-                    end_line=end_line,
-                    full_code=full_code,
-                    has_docstring=analysis['has_docstring'],
-                    current_docstring=analysis['docstring'],
-                    function_name=analysis['function_name'],  # Always present after validation
-                    marker_type=marker_type
-                ))
-
-                # Move to next line (to allow scanning for nested markers of different types)
-                i += 1
-            else:
-                i += 1
+        return list(self.iter_blocks(content, file_path))
+
+    def iter_blocks(self, content: str, file_path: str = "") -> Iterator[DetectedBlock]:
+        """
+        Lazily yield the blocks detect_blocks would return, in file order.
+
+        Markers are paired up front (one regex pass), but each block is only
+        analyzed when requested, so callers that stop early skip the rest.
+
+        Args:
+            content: The file content to search
+            file_path: Optional path to the file (for context)
 
-        return blocks
+        Yields:
+            Detected blocks with their details
+
+        Raises:
+            MarkerValidationError: When a yielded block is malformed
+        """
+        # Pair start/end markers with one stack per type, so nested markers
+        # of the same type close innermost first
+        open_markers = {marker_type: [] for marker_type in MarkerType}
+        spans = []
+        for line_number, marker_type, edge, match in MarkerPatterns.iter_markers(content):
+            if edge == 'start':
+                open_markers[marker_type].append((line_number, match))
+            elif open_markers[marker_type]:
+                start_line, start_match = open_markers[marker_type].pop()
+                spans.append((start_line, line_number, marker_type, start_match, match))
+            # An END with no open START is left to MarkerValidator
+
+        # Unmatched START markers are skipped; blocks are reported in file order
+        spans.sort(key=lambda span: span[0])
+
+        for start_line, end_line, marker_type, start_match, end_match in spans:
+            # Extract code block (everything between markers), sliced
+            # straight from the content
+            full_code = content[start_match.end() + 1:end_match.start() - 1]
+            block_lines = full_code.split('\n') if end_line - start_line > 1 else []
+
+            # Analyze the block based on marker type
+            if marker_type == MarkerType.MODULE_DOC:
+                analysis = self._analyze_module_block(block_lines, file_path)
+            elif marker_type == MarkerType.DOCSTRING:
+                analysis = self._analyze_block(block_lines)
+            elif marker_type == MarkerType.CLASS_DOC:
+                analysis = self._analyze_class_block(block_lines)
+            else:  # MarkerType.COMMENT
+                analysis = self._analyze_comment_block(block_lines, start_line)
+
+            yield DetectedBlock(
+                file_path=file_path,
+                start_line=start_line,
+                end_line=end_line,
+                full_code=full_code,
+                has_docstring=analysis['has_docstring'],
+                current_docstring=analysis['docstring'],
+                function_name=analysis['function_name'],  # Always present after validation
+                marker_type=marker_type
+            )
 
     def _analyze_block(self, block_lines: List[str]) -> Dict:
         """
@@ -221,10 +317,10 @@ class MarkerDetector:
         func_line_idx = None
         for i, line in enumerate(block_lines):
             stripped = line.strip()
-            if stripped.startswith('def ') or stripped.startswith('async def '):
+            if stripped.startswith(('def ', 'async def ')):
                 func_line_idx = i
                 # Extract function name
-                match = re.match(r'(?:async\s+)?def\s+(\w+)', stripped)
+                match = FUNCTION_NAME_PATTERN.match(stripped)
                 if match:
                     result['function_name'] = match.group(1)
                 break
@@ -262,20 +358,15 @@ class MarkerDetector:
         Returns:
             True if it's a placeholder, False otherwise
         """
-        placeholders = [
-            'to_do', 'todo', 'fixme', 'to do',
-            'to_review', 'to review', 'placeholder',
-            'add description', 'description here'
-        ]
-
-        lower = docstring.lower().strip()
+        # Callers pass stripped text, so only case needs normalizing
+        lower = docstring.lower()
 
         # Empty or very short
         if len(lower) < 5:
             return True
 
         # Contains placeholder keywords
-        for placeholder in placeholders:
+        for placeholder in PLACEHOLDER_KEYWORDS:
             if placeholder in lower:
                 return True
 
@@ -300,7 +391,7 @@ class MarkerDetector:
         if docstring_start is not None and docstring_end is not None:
             docstring_lines = block_lines[docstring_start:docstring_end + 1]
             docstring_text = '\n'.join(docstring_lines)
-            docstring_text = docstring_text.strip().strip('"""').strip("'''").strip()
+            docstring_text = strip_triple_quotes(docstring_text)
 
             if docstring_text and not self._is_placeholder(docstring_text):
                 return docstring_text
@@ -333,7 +424,7 @@ class MarkerDetector:
             if stripped.startswith('class '):
                 def_line_idx = i
                 # Extract class name
-                match = re.match(r'class\s+(\w+)', stripped)
+                match = CLASS_NAME_PATTERN.match(stripped)
                 if match:
                     result['function_name'] = match.group(1)
                 break
@@ -426,7 +517,7 @@ class MarkerDetector:
         docstring_start = None
         for i, line in enumerate(block_lines):
             stripped = line.strip()
-            if stripped.startswith('"""') or stripped.startswith("'''"):
+            if stripped.startswith(('"""', "'''")):
                 docstring_start = i
                 break
             elif stripped and not stripped.startswith('#'):
@@ -435,13 +526,13 @@ class MarkerDetector:
 
         if docstring_start is not None:
             # Extract full docstring
-            quote_type = '"""' if block_lines[docstring_start].strip().startswith('"""') else "'''"
-
-            # Check if single-line docstring
             first_line = block_lines[docstring_start].strip()
-            if first_line.count(quote_type) >= 2:
+            quote_type = '"""' if first_line[0] == '"' else "'''"
+
+            # Single-line if the closing quotes follow the opening ones
+            if first_line.find(quote_type, 3) != -1:
                 # Single-line docstring
-                docstring_text = first_line.strip(quote_type).strip()
+                docstring_text = strip_triple_quotes(first_line)
                 if docstring_text and not self._is_placeholder(docstring_text):
                     result['has_docstring'] = True
                     result['docstring'] = docstring_text
@@ -455,8 +546,8 @@ class MarkerDetector:
                         # Found closing quote
                         break
 
-                docstring_text = '\n'.join(docstring_lines)
-                docstring_text = docstring_text.strip().strip(quote_type).strip()
+                # Only the surrounding quotes go (quotes inside the text are kept)
+                docstring_text = strip_triple_quotes('\n'.join(docstring_lines))
 
                 if docstring_text and not self._is_placeholder(docstring_text):
                     result['has_docstring'] = True
@@ -74,14 +74,17 @@ class MarkerValidator:
         issues = []
         lines = content.split('\n')
 
+        # Locate all marker lines once (single regex pass over the content)
+        markers = MarkerPatterns.find_markers(content)
+
         # Check for balanced markers (every START has matching END)
-        issues.extend(self._check_balanced_markers(lines, file_path))
+        issues.extend(self._check_balanced_markers(markers, file_path))
 
         # Check for orphaned END markers
-        issues.extend(self._check_orphaned_ends(lines, file_path))
+        issues.extend(self._check_orphaned_ends(markers, file_path))
 
         # Check for inconsistent indentation
-        issues.extend(self._check_indentation(lines, file_path))
+        issues.extend(self._check_indentation(lines, markers, file_path))
 
         # Check for comment blocks crossing scope boundaries
         issues.extend(self._check_comment_scope(lines, file_path))
@@ -148,26 +151,24 @@ class MarkerValidator:
 
         return issues
 
-    def _check_balanced_markers(self, lines: List[str], file_path: str) -> List[ValidationIssue]:
+    def _check_balanced_markers(self, markers: List[Tuple[int, MarkerType, str]],
+                                file_path: str) -> List[ValidationIssue]:
         """Check that every START marker has a matching END marker."""
         issues = []
 
-        for marker_type, start_pattern in self.start_patterns.items():
-            end_pattern = self.end_patterns[marker_type]
-
-            start_stack = []  # Track START markers
+        # Track START markers per type in a single pass over the marker lines
+        start_stacks = {marker_type: [] for marker_type in self.start_patterns}
 
-            for i, line in enumerate(lines, start=1):
-                if start_pattern.match(line):
-                    start_stack.append(i)
-                elif end_pattern.match(line):
-                    if not start_stack:
-                        # This is handled by _check_orphaned_ends
-                        pass
-                    else:
-                        start_stack.pop()
+        for line_number, marker_type, kind in markers:
+            stack = start_stacks[marker_type]
+            if kind == 'start':
+                stack.append(line_number)
+            elif stack:
+                stack.pop()
+            # END without START is handled by _check_orphaned_ends
 
-            # Any remaining START markers don't have matching END
+        # Any remaining START markers don't have matching END
+        for marker_type, start_stack in start_stacks.items():
             for start_line in start_stack:
                 issues.append(ValidationIssue(
                     level=ValidationLevel.ERROR,
@@ -179,53 +180,50 @@ class MarkerValidator:
 
         return issues
 
-    def _check_orphaned_ends(self, lines: List[str], file_path: str) -> List[ValidationIssue]:
+    def _check_orphaned_ends(self, markers: List[Tuple[int, MarkerType, str]],
+                             file_path: str) -> List[ValidationIssue]:
         """Check for END markers without matching START."""
-        issues = []
-
-        for marker_type, end_pattern in self.end_patterns.items():
-            start_pattern = self.start_patterns[marker_type]
-
-            start_count = 0
+        start_counts = {marker_type: 0 for marker_type in self.end_patterns}
+        orphans = {marker_type: [] for marker_type in self.end_patterns}
+
+        for line_number, marker_type, kind in markers:
+            if kind == 'start':
+                start_counts[marker_type] += 1
+            elif start_counts[marker_type] == 0:
+                orphans[marker_type].append(line_number)
+            else:
+                start_counts[marker_type] -= 1
 
-            for i, line in enumerate(lines, start=1):
-                if start_pattern.match(line):
-                    start_count += 1
-                elif end_pattern.match(line):
-                    if start_count == 0:
-                        issues.append(ValidationIssue(
-                            level=ValidationLevel.ERROR,
-                            message=f"Orphaned {marker_type.value} END marker - no matching START",
-                            file_path=file_path,
-                            line_number=i,
-                            marker_type=marker_type.value
-                        ))
-                    else:
-                        start_count -= 1
+        issues = []
+        for marker_type, orphan_lines in orphans.items():
+            for line_number in orphan_lines:
+                issues.append(ValidationIssue(
+                    level=ValidationLevel.ERROR,
+                    message=f"Orphaned {marker_type.value} END marker - no matching START",
+                    file_path=file_path,
+                    line_number=line_number,
+                    marker_type=marker_type.value
+                ))
 
         return issues
 
-    def _check_indentation(self, lines: List[str], file_path: str) -> List[ValidationIssue]:
+    def _check_indentation(self, lines: List[str], markers: List[Tuple[int, MarkerType, str]],
+                           file_path: str) -> List[ValidationIssue]:
         """Check for suspicious indentation in markers."""
         issues = []
 
-        # All marker patterns
-        all_patterns = list(self.start_patterns.values()) + list(self.end_patterns.values())
+        for i, _, _ in markers:
+            line = lines[i - 1]
+            # Check if marker has significant indentation (more than 8 spaces or 2 tabs)
+            indent = len(line) - len(line.lstrip())
 
-        for i, line in enumerate(lines, start=1):
-            for pattern in all_patterns:
-                if pattern.match(line):
-                    # Check if marker has significant indentation (more than 8 spaces or 2 tabs)
-                    indent = len(line) - len(line.lstrip())
-
-                    if indent > 8 or line.count('\t', 0, indent) > 2:
-                        issues.append(ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            message=f"Marker has unusual indentation ({indent} spaces) - markers should typically be at module/class level",
-                            file_path=file_path,
-                            line_number=i
-                        ))
-                    break
+            if indent > 8 or line.count('\t', 0, indent) > 2:
+                issues.append(ValidationIssue(
+                    level=ValidationLevel.WARNING,
+                    message=f"Marker has unusual indentation ({indent} spaces) - markers should typically be at module/class level",
+                    file_path=file_path,
+                    line_number=i
+                ))
 
         return issues
 
@@ -246,21 +244,15 @@ class MarkerValidator:
         """
         issues = []
 
-        # Get comment marker patterns
-        comment_start = self.start_patterns.get(MarkerType.COMMENT)
-        comment_end = self.end_patterns.get(MarkerType.COMMENT)
-
-        if not comment_start or not comment_end:
-            return issues
-
         # Find all comment block pairs
         comment_blocks = []  # List of (start_line, end_line) tuples
         start_stack = []
 
         for i, line in enumerate(lines, start=1):
-            if comment_start.match(line):
+            marker = MarkerPatterns.match_line(line)
+            if marker == (MarkerType.COMMENT, 'start'):
                 start_stack.append(i)
-            elif comment_end.match(line):
+            elif marker == (MarkerType.COMMENT, 'end'):
                 if start_stack:
                     start_line = start_stack.pop()
                     comment_blocks.append((start_line, i))
@@ -290,7 +282,7 @@ class MarkerValidator:
                 stripped = line.strip()
 
                 # Check for function or class definition
-                if stripped.startswith('def ') or stripped.startswith('async def ') or stripped.startswith('class '):
+                if stripped.startswith(('def ', 'async def ', 'class ')):
                     # Get indentation of this definition
                     def_indent = len(line) - len(line.lstrip())
 
@@ -414,7 +406,7 @@ class MarkerValidator:
         from ..src.constants import MARKER_TO_TASK_TYPE, MARKER_TO_VALIDATE_TYPE
 
         queue = QueueManager()
-        tasks_created = 0
+        tasks = []
 
         for block in blocks:
             # Choose task type based on whether docstring already exists
@@ -435,7 +427,6 @@ class MarkerValidator:
                 scope_name=block.function_name or 'unknown'
             )
 
-            queue.add_task(task)
-            tasks_created += 1
+            tasks.append(task)
 
-        return tasks_created
+        return queue.add_tasks(tasks)
@@ -5,6 +5,14 @@ Pure text manipulation functions with no dependencies on Pydantic or schemas.
 All functions handle line wrapping, indentation normalization, and formatting.
 """
 
+# Google Style section markers
+GOOGLE_SECTION_HEADERS = frozenset([
+    'Args:', 'Arguments:', 'Returns:', 'Return:', 'Yields:',
+    'Raises:', 'Raise:', 'Note:', 'Notes:', 'Example:',
+    'Examples:', 'Attributes:', 'See Also:', 'Warning:',
+    'Warnings:', 'Todo:'
+])
+
 
 def wrap_line(line: str, max_length: int = 79) -> list[str]:
     """
@@ -74,31 +82,23 @@ def wrap_and_normalize(text: str, max_length: int = 79) -> str:
 
     lines = text.split('\n')
 
-    # Step 1: Detect minimum indentation (excluding empty lines)
-    min_indent = float('inf')
-    for line in lines:
-        if line.strip():  # Non-empty line
-            indent = len(line) - len(line.lstrip())
-            min_indent = min(min_indent, indent)
-
-    # If all lines are empty or min_indent is still inf, no normalization needed
-    if min_indent == float('inf'):
-        min_indent = 0
+    # Step 1: Detect minimum indentation (excluding blank lines)
+    min_indent = min(
+        (len(line) - len(line.lstrip()) for line in lines if line and not line.isspace()),
+        default=0
+    )
 
-    # Step 2: Normalize indentation - remove min_indent from all lines
-    normalized_lines = []
-    for line in lines:
-        if not line.strip():
-            # Empty line - keep as-is
-            normalized_lines.append(line)
-        else:
-            # Remove min_indent spaces from the beginning
-            dedented = line[min_indent:] if len(line) > min_indent else line.lstrip()
-            normalized_lines.append(dedented)
+    # Step 2: Normalize indentation - remove min_indent from non-blank lines
+    # (blank lines are kept as-is)
+    if min_indent:
+        lines = [
+            line[min_indent:] if line and not line.isspace() else line
+            for line in lines
+        ]
 
     # Step 3: Apply wrapping to normalized lines
     result = []
-    for line in normalized_lines:
+    for line in lines:
         if not line or len(line) <= max_length:
             result.append(line)
         else:
@@ -156,45 +156,43 @@ def format_google_style_docstring(docstring: str, indent: str) -> str:
     Returns:
         Formatted docstring with consistent indentation
     """
-    # Remove existing quotes if present
-    docstring = docstring.strip().strip('"""').strip("'''").strip()
+    # Remove existing quotes if present (quotes inside the text are kept)
+    docstring = strip_triple_quotes(docstring)
 
-    # Split into lines and strip ALL indentation
-    lines = [line.strip() for line in docstring.split('\n')]
+    # Precompute the prefixes used on every line
+    quote_line = f'{indent}"""'
+    section_indent = f'{indent}    '
 
-    # Google Style section markers
-    section_markers = ['Args:', 'Arguments:', 'Returns:', 'Return:', 'Yields:',
-                      'Raises:', 'Raise:', 'Note:', 'Notes:', 'Example:',
-                      'Examples:', 'Attributes:', 'See Also:', 'Warning:',
-                      'Warnings:', 'Todo:']
+    def emit_lines():
+        """Yield formatted lines with quotes and controlled indentation."""
+        yield quote_line
 
-    # Format with quotes and controlled indentation
-    formatted_lines = [f'{indent}"""']
+        in_section = False
+        # Strip ALL indentation from each line
+        for raw_line in docstring.split('\n'):
+            line = raw_line.strip()
+            if not line:
+                # Empty line
+                yield ''
+                continue
 
-    in_section = False
-    for line in lines:
-        if not line:
-            # Empty line
-            formatted_lines.append('')
-            continue
-
-        # Check if this is a section header
-        is_section_header = any(line.startswith(marker) for marker in section_markers)
-
-        if is_section_header:
-            # Section header: base indent only
-            formatted_lines.append(f'{indent}{line}')
-            in_section = True
-        elif in_section:
-            # Content inside a section: base indent + 4 spaces
-            formatted_lines.append(f'{indent}    {line}')
-        else:
-            # Summary or extended description: base indent only
-            formatted_lines.append(f'{indent}{line}')
+            # Check if this is a section header (text up to first ':' is a marker)
+            head, sep, _ = line.partition(':')
+
+            if sep and head + sep in GOOGLE_SECTION_HEADERS:
+                # Section header: base indent only
+                in_section = True
+                yield indent + line
+            elif in_section:
+                # Content inside a section: base indent + 4 spaces
+                yield section_indent + line
+            else:
+                # Summary or extended description: base indent only
+                yield indent + line
 
-    formatted_lines.append(f'{indent}"""')
+        yield quote_line
 
-    return '\n'.join(formatted_lines)
+    return '\n'.join(emit_lines())
 
 
 def strip_triple_quotes(text: str) -> str:
@@ -211,9 +209,9 @@ def strip_triple_quotes(text: str) -> str:
         Text with triple quotes removed from start and end
     """
     text = text.strip()
-    if text.startswith('"""') or text.startswith("'''"):
+    if text.startswith(('"""', "'''")):
         text = text[3:]
-    if text.endswith('"""') or text.endswith("'''"):
+    if text.endswith(('"""', "'''")):
         text = text[:-3]
     return text.strip()
 
@@ -43,7 +43,7 @@ setup(
     install_requires=[
         "click>=8.0.0",
         "pyyaml>=6.0",
-        "anthropic>=0.18.0",
+        "anthropic>=0.42.0",
         "openai>=1.0.0",
         "python-dotenv>=1.0.0",
     ],
@@ -57,6 +57,12 @@ setup(
         "ollama": [
             "ollama>=0.1.0",
         ],
+        "re2": [
+            "google-re2>=1.0",
+        ],
+        "http2": [
+            "httpx[http2]",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,366 @@
+"""Test batched application of suggestions by the Applier."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from llm_doc_manager.src.applier import Applier, Suggestion
+from llm_doc_manager.src.config import Config, OutputConfig
+
+
+SOURCE = '''# @llm-module-start
+"""Old module docstring."""
+# @llm-module-end
+
+# @llm-doc-start
+def first(a):
+    return a
+# @llm-doc-end
+
+# @llm-comm-start
+value = first(1)
+# @llm-comm-end
+
+# @llm-doc-start
+def second(b):
+    """Old docstring."""
+    return b
+# @llm-doc-end
+'''
+
+
+def _make_applier(tmp_dir: str) -> Applier:
+    config = Config(output=OutputConfig(backup=True, backup_dir=str(Path(tmp_dir) / 'backups')))
+    return Applier(config, queue_manager=None)
+
+
+def test_apply_suggestions_single_write_per_file():
+    """Test that several suggestions for one file are applied in one pass."""
+    print("=" * 70)
+    print("TEST: Batched apply_suggestions")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_text(SOURCE, encoding='utf-8')
+        applier = _make_applier(tmp_dir)
+
+        suggestions = [
+            Suggestion(1, str(file_path), 1, '', 'New module docstring.', 'validate_module'),
+            Suggestion(2, str(file_path), 5, '', 'Return a unchanged.', 'validate_docstring'),
+            Suggestion(3, str(file_path), 10, '', 'Call first with one', 'generate_comment'),
+            Suggestion(4, str(file_path), 14, '', 'Return b unchanged.', 'validate_docstring'),
+        ]
+
+        written = applier.apply_suggestions(suggestions)
+        result = file_path.read_text(encoding='utf-8')
+        print(result)
+
+        assert list(written) == [str(file_path)]
+        assert written[str(file_path)] == result
+        assert all(s.applied for s in suggestions)
+        assert 'New module docstring.' in result
+        assert 'Old module docstring.' not in result
+        assert '    Return a unchanged.' in result
+        assert '# Call first with one\nvalue = first(1)' in result
+        assert '    Return b unchanged.' in result
+        assert 'Old docstring.' not in result
+        backups = list((Path(tmp_dir) / 'backups').iterdir())
+        assert len(backups) == 1
+        assert backups[0].read_text(encoding='utf-8') == SOURCE
+
+    print("\n[PASS] All suggestions applied with a single write")
+
+
+def test_apply_suggestions_multiple_files():
+    """Test that suggestions spread over several files are all applied."""
+    print("\n" + "=" * 70)
+    print("TEST: apply_suggestions across files")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = [Path(tmp_dir) / f'sample_{i}.py' for i in range(5)]
+        for path in paths:
+            path.write_text(SOURCE, encoding='utf-8')
+        applier = _make_applier(tmp_dir)
+
+        suggestions = [
+            Suggestion(i, str(path), 14, '', f'Docstring {i}.', 'validate_docstring')
+            for i, path in enumerate(paths)
+        ]
+
+        written = applier.apply_suggestions(suggestions)
+
+        assert sorted(written) == sorted(str(p) for p in paths)
+        for i, path in enumerate(paths):
+            assert f'Docstring {i}.' in path.read_text(encoding='utf-8')
+
+    print("\n[PASS] Every file received its own suggestion")
+
+
+def test_apply_suggestions_groups_path_spellings():
+    """Test that relative, absolute and symlinked paths to one file share a group."""
+    print("\n" + "=" * 70)
+    print("TEST: apply_suggestions path spellings")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_text(SOURCE, encoding='utf-8')
+        link_path = Path(tmp_dir) / 'link.py'
+        link_path.symlink_to(file_path)
+        applier = _make_applier(tmp_dir)
+
+        suggestions = [
+            Suggestion(1, str(file_path), 1, '', 'New module docstring.', 'validate_module'),
+            Suggestion(2, os.path.relpath(file_path), 5, '', 'Return a unchanged.', 'validate_docstring'),
+            Suggestion(3, str(link_path), 14, '', 'Return b unchanged.', 'validate_docstring'),
+        ]
+
+        written = applier.apply_suggestions(suggestions)
+        result = file_path.read_text(encoding='utf-8')
+
+        assert list(written) == [str(file_path)]
+        assert all(s.applied for s in suggestions)
+        assert 'New module docstring.' in result
+        assert 'Return a unchanged.' in result
+        assert 'Return b unchanged.' in result
+        assert link_path.is_symlink()
+        assert len(list((Path(tmp_dir) / 'backups').iterdir())) == 1
+
+    print("\n[PASS] Edits through every spelling landed in one write")
+
+
+def test_apply_suggestions_reports_failures():
+    """Test that an invalid suggestion fails without blocking the others."""
+    print("\n" + "=" * 70)
+    print("TEST: apply_suggestions failure isolation")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_text(SOURCE, encoding='utf-8')
+        applier = _make_applier(tmp_dir)
+
+        good = Suggestion(1, str(file_path), 5, '', 'Return a unchanged.', 'validate_docstring')
+        bad = Suggestion(2, str(file_path), 999, '', 'Out of range.', 'validate_docstring')
+
+        applier.apply_suggestions([good, bad])
+
+        assert good.applied
+        assert not bad.applied
+        assert 'Return a unchanged.' in file_path.read_text(encoding='utf-8')
+
+    print("\n[PASS] Failed suggestion isolated from successful ones")
+
+
+def test_apply_suggestion_uses_batched_path():
+    """Test that the single-suggestion API still applies and reports."""
+    print("\n" + "=" * 70)
+    print("TEST: apply_suggestion wrapper")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_text(SOURCE, encoding='utf-8')
+        applier = _make_applier(tmp_dir)
+
+        suggestion = Suggestion(1, str(file_path), 14, '', 'Return b unchanged.', 'validate_docstring')
+
+        assert applier.apply_suggestion(suggestion)
+        assert suggestion.applied
+        assert 'Return b unchanged.' in file_path.read_text(encoding='utf-8')
+
+    print("\n[PASS] apply_suggestion applies through apply_suggestions")
+
+
+def test_apply_suggestions_skips_unchanged_file():
+    """Test that re-applying an identical suggestion writes nothing."""
+    print("\n" + "=" * 70)
+    print("TEST: apply_suggestions no-op detection")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_text(SOURCE, encoding='utf-8')
+
+        first = Suggestion(1, str(file_path), 14, '', 'Return b unchanged.', 'validate_docstring')
+        _make_applier(tmp_dir).apply_suggestions([first])
+        mtime = file_path.stat().st_mtime_ns
+
+        again = Suggestion(2, str(file_path), 14, '', 'Return b unchanged.', 'validate_docstring')
+        applier = _make_applier(tmp_dir)
+        written = applier.apply_suggestions([again])
+
+        assert again.applied
+        assert written == {}
+        assert file_path.stat().st_mtime_ns == mtime
+        assert len(list((Path(tmp_dir) / 'backups').iterdir())) == 1
+
+    print("\n[PASS] Unchanged file neither backed up nor rewritten")
+
+
+def test_apply_suggestions_preserves_crlf():
+    """Test that CRLF files keep their line endings after apply."""
+    print("\n" + "=" * 70)
+    print("TEST: apply_suggestions line endings")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_bytes(SOURCE.replace('\n', '\r\n').encode('utf-8'))
+        applier = _make_applier(tmp_dir)
+
+        applier.apply_suggestion(
+            Suggestion(1, str(file_path), 14, '', 'Return b unchanged.', 'validate_docstring')
+        )
+        raw = file_path.read_bytes()
+
+        assert b'Return b unchanged.' in raw
+        assert raw.count(b'\n') == raw.count(b'\r\n')
+
+    print("\n[PASS] CRLF line endings preserved")
+
+
+def test_apply_change_dispatch_by_task_type():
+    """Test that every task type reaches its handler and unknown ones are no-ops."""
+    print("\n" + "=" * 70)
+    print("TEST: _apply_change dispatch")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        applier = _make_applier(tmp_dir)
+
+        for task_type, line_number, expected in [
+            ('generate_module', 1, '"""\nText.\n"""'),
+            ('validate_class', 14, '    Text.'),
+            ('generate_docstring', 5, '    Text.'),
+            ('validate_comment', 10, '# Text'),
+        ]:
+            lines = SOURCE.split('\n')
+            applier._apply_change(lines, line_number, '', 'Text.' if 'comment' not in task_type else 'Text',
+                                  task_type)
+            assert expected in '\n'.join(lines), task_type
+
+        lines = SOURCE.split('\n')
+        applier._apply_change(lines, 5, '', 'Text.', 'unknown_type')
+        assert '\n'.join(lines) == SOURCE
+
+    print("\n[PASS] Task types dispatched to their handlers")
+
+
+def test_backup_once_per_file_across_calls():
+    """Test that a second apply in the same session keeps the first backup."""
+    print("\n" + "=" * 70)
+    print("TEST: one backup per file per session")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_text(SOURCE, encoding='utf-8')
+        applier = _make_applier(tmp_dir)
+
+        applier.apply_suggestion(
+            Suggestion(1, str(file_path), 14, '', 'Return b unchanged.', 'validate_docstring')
+        )
+        applier.apply_suggestion(
+            Suggestion(2, str(file_path), 5, '', 'Return a unchanged.', 'validate_docstring')
+        )
+
+        backups = list((Path(tmp_dir) / 'backups').iterdir())
+        assert len(backups) == 1
+        assert backups[0].read_text(encoding='utf-8') == SOURCE
+
+    print("\n[PASS] Original content backed up exactly once")
+
+
+def test_backup_never_overwrites_existing_name():
+    """Test that a taken backup name gets a counter instead of being reused."""
+    print("\n" + "=" * 70)
+    print("TEST: backup name collision")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_text(SOURCE, encoding='utf-8')
+        applier = _make_applier(tmp_dir)
+
+        first = applier._create_backup(file_path, '20250101_000000')
+        second = applier._create_backup(file_path, '20250101_000000')
+
+        assert first != second
+        assert second.name.endswith('-1.bak')
+        assert first.read_text(encoding='utf-8') == SOURCE
+        assert second.read_text(encoding='utf-8') == SOURCE
+
+    print("\n[PASS] Existing backup kept, new one created under a fresh name")
+
+
+def test_rollback_restores_latest_backup():
+    """Test that rollback restores the pre-apply content."""
+    print("\n" + "=" * 70)
+    print("TEST: rollback")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'sample.py'
+        file_path.write_text(SOURCE, encoding='utf-8')
+        applier = _make_applier(tmp_dir)
+
+        applier.apply_suggestion(
+            Suggestion(1, str(file_path), 14, '', 'Return b unchanged.', 'validate_docstring')
+        )
+        assert file_path.read_text(encoding='utf-8') != SOURCE
+
+        assert applier.rollback(str(file_path))
+        assert file_path.read_text(encoding='utf-8') == SOURCE
+        assert not applier.rollback(str(Path(tmp_dir) / 'other.py'))
+
+    print("\n[PASS] Rollback restored the original content")
+
+
+def test_rollback_same_name_in_different_dirs():
+    """Test that same-named files in different directories keep separate backups."""
+    print("\n" + "=" * 70)
+    print("TEST: rollback of same-named files")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = [Path(tmp_dir) / pkg / '__init__.py' for pkg in ('a', 'b')]
+        for pkg, path in zip(('a', 'b'), paths):
+            path.parent.mkdir()
+            path.write_text(SOURCE.replace('first', f'first_{pkg}'), encoding='utf-8')
+        originals = [path.read_text(encoding='utf-8') for path in paths]
+        applier = _make_applier(tmp_dir)
+
+        applier.apply_suggestions([
+            Suggestion(i, str(path), 14, '', 'Return b unchanged.', 'validate_docstring')
+            for i, path in enumerate(paths)
+        ])
+
+        assert len(list((Path(tmp_dir) / 'backups').iterdir())) == 2
+        for path, original in zip(paths, originals):
+            assert path.read_text(encoding='utf-8') != original
+            assert applier.rollback(str(path))
+            assert path.read_text(encoding='utf-8') == original
+
+    print("\n[PASS] Each file rolled back to its own original")
+
+
+if __name__ == "__main__":
+    test_apply_suggestions_single_write_per_file()
+    test_apply_suggestions_multiple_files()
+    test_apply_suggestions_groups_path_spellings()
+    test_apply_suggestions_reports_failures()
+    test_apply_suggestion_uses_batched_path()
+    test_apply_suggestions_skips_unchanged_file()
+    test_apply_suggestions_preserves_crlf()
+    test_apply_change_dispatch_by_task_type()
+    test_backup_once_per_file_across_calls()
+    test_backup_never_overwrites_existing_name()
+    test_rollback_restores_latest_backup()
+    test_rollback_same_name_in_different_dirs()
+
+    print("\n" + "=" * 70)
+    print("ALL APPLIER TESTS PASSED!")
+    print("=" * 70)
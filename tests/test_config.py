@@ -0,0 +1,73 @@
+"""Test ConfigManager loading and its parsed-YAML cache."""
+
+import os
+import tempfile
+from dataclasses import asdict
+
+from llm_doc_manager.src.config import Config, ConfigManager
+
+
+def test_load_reuses_parsed_yaml_until_file_changes():
+    """Test that loads share the parse but never share Config objects."""
+    print("=" * 70)
+    print("TEST: ConfigManager YAML cache")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = ConfigManager(tmp_dir)
+        manager.init_config()
+
+        first = manager.load()
+        first.scanning.exclude.append('mutated')
+        second = ConfigManager(tmp_dir).load()
+
+        assert 'mutated' not in second.scanning.exclude
+        assert str(manager.config_file.resolve()) in ConfigManager._yaml_cache
+
+        # Editing the file invalidates the cached parse
+        content = manager.config_file.read_text(encoding='utf-8')
+        manager.config_file.write_text(
+            content.replace('max_file_size_mb: 5', 'max_file_size_mb: 12'),
+            encoding='utf-8'
+        )
+        assert ConfigManager(tmp_dir).load().scanning.max_file_size_mb == 12
+
+    print("\n[PASS] Cached parse reused and invalidated on change")
+
+
+def test_to_dict_matches_asdict():
+    """Test that the shallow serialization equals asdict and is independent."""
+    config = Config()
+    data = config.to_dict()
+
+    assert data['llm'] == asdict(config.llm)
+    assert data['scanning'] == asdict(config.scanning)
+    assert data['output'] == asdict(config.output)
+
+    data['scanning']['exclude'].append('mutated')
+    assert 'mutated' not in config.scanning.exclude
+
+
+def test_resolve_env_vars_anywhere_in_strings():
+    """Test ${VAR} substitution inside strings, lists and nested dicts."""
+    os.environ['LLM_DOC_MANAGER_TEST_DIR'] = 'docs'
+    try:
+        resolved = ConfigManager()._resolve_env_vars({
+            'output': {'docs_dir': '${LLM_DOC_MANAGER_TEST_DIR}'},
+            'paths': ['src/${LLM_DOC_MANAGER_TEST_DIR}/api', 42],
+            'missing': 'keep ${LLM_DOC_MANAGER_UNSET_VAR}',
+        })
+    finally:
+        del os.environ['LLM_DOC_MANAGER_TEST_DIR']
+
+    assert resolved == {
+        'output': {'docs_dir': 'docs'},
+        'paths': ['src/docs/api', 42],
+        'missing': 'keep ${LLM_DOC_MANAGER_UNSET_VAR}',
+    }
+
+
+if __name__ == "__main__":
+    test_load_reuses_parsed_yaml_until_file_changes()
+    test_to_dict_matches_asdict()
+    test_resolve_env_vars_anywhere_in_strings()
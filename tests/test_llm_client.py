@@ -0,0 +1,115 @@
+"""Test LLM client helpers that do not require a provider SDK."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from llm_doc_manager.utils.llm_client import AnthropicClient, RateLimiter
+
+
+def test_rate_limiter_spaces_requests():
+    """Test that concurrent callers are paced to the configured RPM."""
+    print("=" * 70)
+    print("TEST: RateLimiter pacing")
+    print("=" * 70)
+
+    limiter = RateLimiter(rpm=6000)  # One slot every 10 ms
+    stamps = []
+
+    def worker():
+        limiter.acquire()
+        stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    elapsed = max(stamps) - start
+    print(f"5 requests took {elapsed * 1000:.1f} ms")
+    assert elapsed >= 0.035
+
+    print("\n[PASS] Requests spaced by the RPM interval")
+
+
+def test_rate_limiter_token_budget():
+    """Test that large requests delay the next one by their token share."""
+    print("\n" + "=" * 70)
+    print("TEST: RateLimiter token budget")
+    print("=" * 70)
+
+    limiter = RateLimiter(rpm=None, tpm=60000)  # 1 token per ms
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire(tokens=20)
+    elapsed = time.monotonic() - start
+
+    print(f"3 x 20-token requests took {elapsed * 1000:.1f} ms")
+    assert elapsed >= 0.035
+
+    print("\n[PASS] Requests spaced by their estimated tokens")
+
+
+def test_rate_limiter_disabled():
+    """Test that rpm=None never blocks."""
+    limiter = RateLimiter(rpm=None)
+    start = time.monotonic()
+    for _ in range(1000):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.5
+
+
+class _FakeMessageBatches:
+    """Stand-in for anthropic's client.messages.batches."""
+
+    def __init__(self):
+        self.submitted = None
+        self.status = 'in_progress'
+
+    def create(self, requests):
+        self.submitted = requests
+        return SimpleNamespace(id='msgbatch_1')
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status=self.status)
+
+    def results(self, batch_id):
+        usage = SimpleNamespace(input_tokens=10, output_tokens=5)
+        message = SimpleNamespace(content=[SimpleNamespace(text='{"comment": "x"}')], usage=usage)
+        return [
+            SimpleNamespace(custom_id='1', result=SimpleNamespace(type='succeeded', message=message)),
+            SimpleNamespace(custom_id='2', result=SimpleNamespace(type='errored')),
+        ]
+
+
+def test_anthropic_message_batches():
+    """Test Anthropic batch submission and result collection."""
+    print("\n" + "=" * 70)
+    print("TEST: AnthropicClient batch jobs")
+    print("=" * 70)
+
+    batches = _FakeMessageBatches()
+    client = AnthropicClient.__new__(AnthropicClient)
+    client.model, client.temperature, client.max_tokens = 'claude-test', 0.2, 100
+    client.client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+
+    assert AnthropicClient.supports_batch
+    assert client.submit_batch([('1', 'Prompt one', None), ('2', 'Prompt two', None)]) == 'msgbatch_1'
+    assert [r['custom_id'] for r in batches.submitted] == ['1', '2']
+    assert batches.submitted[0]['params']['messages'] == [{"role": "user", "content": "Prompt one"}]
+
+    assert client.retrieve_batch('msgbatch_1') == ('in_progress', None)
+
+    batches.status = 'ended'
+    assert client.retrieve_batch('msgbatch_1') == ('ended', {'1': ('{"comment": "x"}', 15)})
+
+    print("\n[PASS] Message batch submitted and collected")
+
+
+if __name__ == "__main__":
+    test_rate_limiter_spaces_requests()
+    test_rate_limiter_token_budget()
+    test_rate_limiter_disabled()
+    test_anthropic_message_batches()
@@ -0,0 +1,212 @@
+"""Test marker pattern definitions."""
+
+from llm_doc_manager.utils.marker_detector import (
+    MarkerDetector, MarkerPatterns, MarkerType, MarkerValidationError
+)
+from llm_doc_manager.utils.marker_validator import MarkerValidator
+
+
+SAMPLE_LINES = [
+    "# @llm-module-start",
+    "    # @llm-doc-start",
+    "#@llm-class-end  ",
+    "\t# @llm-comm-start",
+    "# @llm-comm-end",
+    "# @llm-doc-starts",
+    "x = 1  # @llm-doc-start",
+    "# @llm-unknown-start",
+    "# regular comment",
+    "",
+]
+
+
+def test_any_marker_matches_individual_patterns():
+    """Test that the union pattern agrees with the per-type patterns."""
+    print("=" * 70)
+    print("TEST: MarkerPatterns.ANY_MARKER_RE")
+    print("=" * 70)
+
+    compiled = MarkerPatterns.get_compiled_patterns()
+    all_patterns = [p for pair in compiled.values() for p in pair.values()]
+
+    for line in SAMPLE_LINES:
+        expected = any(p.match(line) for p in all_patterns)
+        result = bool(MarkerPatterns.ANY_MARKER_RE.match(line))
+        assert result == expected, f"Mismatch for {line!r}: got {result}, expected {expected}"
+        print(f"[OK] {line!r} -> {result}")
+
+    print("\n[PASS] Union pattern matches exactly the marker lines")
+
+
+def test_match_line_matches_individual_patterns():
+    """Test that the literal line check agrees with the per-type patterns."""
+    print("\n" + "=" * 70)
+    print("TEST: MarkerPatterns.match_line")
+    print("=" * 70)
+
+    compiled = MarkerPatterns.get_compiled_patterns()
+    lines = SAMPLE_LINES + ["\u00a0# @llm-doc-end\u2003", "#\t@llm-class-start\r", "##@llm-doc-start"]
+
+    for line in lines:
+        expected = next(
+            ((mtype, edge) for mtype, pair in compiled.items()
+             for edge, pattern in pair.items() if pattern.match(line)),
+            None
+        )
+        result = MarkerPatterns.match_line(line)
+        assert result == expected, f"Mismatch for {line!r}: got {result}, expected {expected}"
+        print(f"[OK] {line!r} -> {result}")
+
+    print("\n[PASS] Literal check matches exactly the marker lines")
+
+
+def test_find_markers_line_numbers():
+    """Test single-pass marker scan reports correct 1-indexed lines."""
+    print("\n" + "=" * 70)
+    print("TEST: MarkerPatterns.find_markers")
+    print("=" * 70)
+
+    content = "\n".join(SAMPLE_LINES) + "\r\n\n\n    # @llm-doc-end\r\n"
+    markers = MarkerPatterns.find_markers(content)
+    print(markers)
+
+    assert markers == [
+        (1, MarkerType.MODULE_DOC, 'start'),
+        (2, MarkerType.DOCSTRING, 'start'),
+        (3, MarkerType.CLASS_DOC, 'end'),
+        (4, MarkerType.COMMENT, 'start'),
+        (5, MarkerType.COMMENT, 'end'),
+        (13, MarkerType.DOCSTRING, 'end'),
+    ]
+
+    print("\n[PASS] Marker lines and types detected in one pass")
+
+
+def test_detect_blocks_pairs_markers():
+    """Test nested, empty and unmatched blocks from the single-pass scan."""
+    print("\n" + "=" * 70)
+    print("TEST: MarkerDetector.detect_blocks")
+    print("=" * 70)
+
+    content = "\n".join([
+        "# @llm-class-start",       # 1
+        "class A:",
+        "    # @llm-doc-start",     # 3
+        "    def f(self):",
+        "        # @llm-comm-start",  # 5
+        "        # @llm-comm-end",    # 6
+        "        return 1",
+        "    # @llm-doc-end",       # 8
+        "# @llm-class-end",         # 9
+        "# @llm-doc-start",         # 10 - never closed
+        "# @llm-comm-end",          # 11 - orphaned
+    ])
+    blocks = MarkerDetector().detect_blocks(content, "sample.py")
+    spans = [(b.start_line, b.end_line, b.marker_type) for b in blocks]
+    print(spans)
+
+    assert spans == [
+        (1, 9, MarkerType.CLASS_DOC),
+        (3, 8, MarkerType.DOCSTRING),
+        (5, 6, MarkerType.COMMENT),
+    ]
+    assert blocks[0].full_code == "\n".join(content.split("\n")[1:8])
+    assert blocks[1].function_name == "f"
+    assert blocks[2].full_code == ""
+
+    print("\n[PASS] Blocks paired and sliced from the content")
+
+
+def test_iter_blocks_is_lazy():
+    """Test that blocks are analyzed only as they are consumed."""
+    print("\n" + "=" * 70)
+    print("TEST: MarkerDetector.iter_blocks")
+    print("=" * 70)
+
+    content = "\n".join([
+        "# @llm-module-start",
+        '"""Module."""',
+        "# @llm-module-end",
+        "# @llm-doc-start",
+        "x = 1",  # no def: analyzing this block raises
+        "# @llm-doc-end",
+    ])
+    detector = MarkerDetector()
+    blocks = detector.iter_blocks(content, "sample.py")
+
+    first = next(blocks)
+    assert first.marker_type == MarkerType.MODULE_DOC
+    assert first.current_docstring == "Module."
+
+    try:
+        next(blocks)
+        assert False, "Expected MarkerValidationError"
+    except MarkerValidationError:
+        pass
+
+    try:
+        detector.detect_blocks(content, "sample.py")
+        assert False, "Expected MarkerValidationError"
+    except MarkerValidationError:
+        pass
+
+    print("\n[PASS] Malformed block only raised when reached")
+
+
+def test_module_docstring_keeps_inner_quotes():
+    """Test that only the surrounding triple quotes of a module docstring are removed."""
+    detector = MarkerDetector()
+
+    single = "\n".join([
+        "# @llm-module-start",
+        '""""Quoted" helpers for "names""""',
+        "# @llm-module-end",
+    ])
+    block = detector.detect_blocks(single, "sample.py")[0]
+    assert block.current_docstring == '"Quoted" helpers for "names"'
+
+    multi = "\n".join([
+        "# @llm-module-start",
+        "''''Raw' parsing.",
+        "",
+        "Ends with 'x''''",
+        "# @llm-module-end",
+    ])
+    block = detector.detect_blocks(multi, "sample.py")[0]
+    assert block.current_docstring == "'Raw' parsing.\n\nEnds with 'x'"
+
+
+def test_validator_balance_checks():
+    """Test unmatched START and orphaned END detection."""
+    print("\n" + "=" * 70)
+    print("TEST: MarkerValidator balance checks")
+    print("=" * 70)
+
+    content = "\n".join([
+        "# @llm-doc-end",
+        "# @llm-doc-start",
+        "def f():",
+        "    pass",
+        "# @llm-doc-end",
+        "# @llm-class-start",
+        "class A:",
+        "    pass",
+    ])
+    issues = MarkerValidator().validate_file(content, "sample.py")
+    messages = [(issue.line_number, issue.message) for issue in issues]
+    print(messages)
+
+    assert (6, "Unmatched class_doc START marker - missing END") in messages
+    assert (1, "Orphaned docstring END marker - no matching START") in messages
+
+    print("\n[PASS] Balance checks report the right lines")
+
+
+if __name__ == "__main__":
+    test_any_marker_matches_individual_patterns()
+    test_match_line_matches_individual_patterns()
+    test_find_markers_line_numbers()
+    test_detect_blocks_pairs_markers()
+    test_iter_blocks_is_lazy()
+    test_module_docstring_keeps_inner_quotes()
+    test_validator_balance_checks()
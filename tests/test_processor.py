@@ -0,0 +1,359 @@
+"""Test Processor helpers that do not call an LLM."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from llm_doc_manager.src import processor as processor_module
+from llm_doc_manager.src.config import Config
+from llm_doc_manager.src.processor import Processor
+from llm_doc_manager.src.queue import DocTask, QueueManager, TaskStatus
+
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "llm_doc_manager" / "templates"
+
+MODULE_RESPONSE = json.dumps({"summary": "Do things.", "extended_description": "More."})
+
+
+class _Interrupted(BaseException):
+    """Stands in for Ctrl+C: not caught by the per-task error handling."""
+
+
+class StubLLMClient:
+    """LLM client double: respond(prompt) gives the (response, tokens) of each call."""
+
+    supports_structured_outputs = True
+    supports_batch = False
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.prompts = []
+
+    def call(self, prompt, temperature=None, max_tokens=None, json_schema=None, system=None):
+        self.prompts.append(prompt)
+        return self.respond(prompt)
+
+
+def _make_processor(queue_manager, llm_client) -> Processor:
+    """Build a Processor that talks to llm_client instead of a provider SDK."""
+    original = processor_module._create_llm_client
+    processor_module._create_llm_client = lambda *args: llm_client
+    config = Config()
+    config.llm.rate_limit_rpm = None  # No pacing between stub calls
+    try:
+        return Processor(config, queue_manager)
+    finally:
+        processor_module._create_llm_client = original
+
+
+def test_split_template_keeps_prompt():
+    """Test that instructions + task part rebuild the original prompt."""
+    print("=" * 70)
+    print("TEST: Processor._split_template")
+    print("=" * 70)
+
+    values = dict(file_path='a.py', line_number=3, context='x = 1', current_docstring='Doc.')
+    for name in ('docstring_generate', 'docstring_validate', 'class_generate',
+                 'module_validate', 'comment_generate'):
+        template = (TEMPLATE_DIR / f"{name}.md").read_text(encoding='utf-8')
+        system, task_template = Processor._split_template(template)
+
+        assert system and '{' not in system
+        assert system + "\n" + task_template.format(**values) == template.format(**values)
+        print(f"{name}: {len(system)} chars of shared instructions")
+
+    # Escaped braces in the instructions are unescaped like format() would
+    system, task_template = Processor._split_template("Use {{}} literally.\n## Code\n{context}")
+    assert system == "Use {} literally."
+    assert task_template == "## Code\n{context}"
+
+    assert Processor._split_template("{context}\nRules.") == ("", "{context}\nRules.")
+    assert Processor._split_template("No fields.") == ("", "No fields.")
+
+    print("\n[PASS] Templates split without changing the prompt")
+
+
+def test_make_batches_groups_by_type():
+    """Test that batches never mix task types and respect the size."""
+    tasks = [
+        DocTask(id=i, task_type=task_type)
+        for i, task_type in enumerate(['generate_docstring', 'validate_class',
+                                       'generate_docstring', 'generate_docstring'])
+    ]
+
+    assert Processor.make_batches(tasks, 1) == [[task] for task in tasks]
+
+    batches = Processor.make_batches(tasks, 2)
+    assert [[task.id for task in batch] for batch in batches] == [[0, 2], [3], [1]]
+
+
+def test_strip_code_fence():
+    """Test that fenced JSON is unwrapped and plain JSON is left alone."""
+    body = '{"comment": "Add one"}'
+
+    assert Processor._strip_code_fence(body) == body
+    assert Processor._strip_code_fence(f"```json\n{body}\n```") == body
+    assert Processor._strip_code_fence(f"\n  ```python\n{body}\n```\n") == body
+    assert Processor._strip_code_fence(f"```{body}```") == body
+    assert Processor._strip_code_fence(f"Here:\n```json\n{body}\n```") == f"Here:\n```json\n{body}\n```"
+
+
+def test_load_templates_cached():
+    """Test that templates are read and split once per process."""
+    templates, parts = Processor._load_templates()
+
+    assert set(templates) == set(parts)
+    assert parts['docstring_generate'] == Processor._split_template(templates['docstring_generate'])
+    assert Processor._load_templates()[0] is templates
+
+
+def test_parse_and_format_response_dispatch():
+    """Test that each task type's response is parsed with its schema."""
+    processor = Processor.__new__(Processor)  # No LLM client needed for parsing
+
+    comment = processor._parse_and_format_response(
+        '```json\n{"comment": "Add one"}\n```', DocTask(task_type='generate_comment')
+    )
+    assert comment == 'Add one'
+
+    validation = processor._parse_and_format_response(
+        '{"is_valid": false, "issues": ["Too long"]}', DocTask(task_type='validate_comment')
+    )
+    assert json.loads(validation)['issues'] == ['Too long']
+
+    module = processor._parse_and_format_response(
+        json.dumps({"summary": "Do things.", "extended_description": "More."}),
+        DocTask(task_type='generate_module')
+    )
+    assert type(module).__name__ == 'ModuleDocstring' and module.summary == 'Do things.'
+
+    # Unknown types and invalid payloads fall back to the raw response
+    assert processor._parse_and_format_response('{}', DocTask(task_type='other')) == '{}'
+    assert processor._parse_and_format_response(' nope ', DocTask(task_type='generate_comment')) == 'nope'
+
+
+def _add_comment_tasks(queue_manager: QueueManager, count: int):
+    """Queue generate_comment tasks whose code is CODE_<index>."""
+    return [
+        queue_manager.get_task(queue_manager.add_task(DocTask(
+            file_path='sample.py', line_number=index + 1,
+            task_type='generate_comment', context=f'x = {index}  # CODE_{index}'
+        )))
+        for index in range(count)
+    ]
+
+
+def _respond_per_task(batch_response):
+    """Answer packed prompts with batch_response and single prompts by CODE_<index>."""
+    def respond(prompt):
+        if '### TASK' in prompt:
+            return batch_response, 10
+        index = prompt.split('# CODE_')[1].split()[0]
+        return json.dumps({"comment": f"Single {index}"}), 5
+    return respond
+
+
+def test_process_tasks_batch_maps_results():
+    """Test that one packed request is split back into per-task results."""
+    print("\n" + "=" * 70)
+    print("TEST: Processor.process_tasks_batch")
+    print("=" * 70)
+
+    batch_response = json.dumps({"results": [{"comment": f"Batched {i}"} for i in range(3)]})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        queue_manager = QueueManager(str(Path(tmp_dir) / 'queue.db'))
+        tasks = _add_comment_tasks(queue_manager, 3)
+        client = StubLLMClient(_respond_per_task(batch_response))
+        processor = _make_processor(queue_manager, client)
+
+        results = processor.process_tasks_batch(tasks)
+
+        # One request, tasks packed in order under numbered labels
+        assert len(client.prompts) == 1
+        prompt = client.prompts[0]
+        assert prompt.index('### TASK 1') < prompt.index('CODE_0') < prompt.index('### TASK 2') \
+            < prompt.index('CODE_1') < prompt.index('### TASK 3') < prompt.index('CODE_2')
+
+        # Tokens split evenly, remainder to the first task
+        assert [(r.task_id, r.success, r.suggestion, r.tokens_used) for r in results] == [
+            (tasks[0].id, True, 'Batched 0', 4),
+            (tasks[1].id, True, 'Batched 1', 3),
+            (tasks[2].id, True, 'Batched 2', 3),
+        ]
+        for index, task in enumerate(tasks):
+            stored = queue_manager.get_task(task.id)
+            assert stored.status == TaskStatus.COMPLETED.value
+            assert stored.suggestion == f'Batched {index}'
+
+    print("\n[PASS] Batched results mapped back by index")
+
+
+def test_process_tasks_batch_falls_back():
+    """Test that a short result list or invalid JSON falls back to one call per task."""
+    print("\n" + "=" * 70)
+    print("TEST: Processor.process_tasks_batch fallback")
+    print("=" * 70)
+
+    short_list = json.dumps({"results": [{"comment": "Batched 0"}, {"comment": "Batched 1"}]})
+
+    for batch_response in (short_list, 'not json'):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            queue_manager = QueueManager(str(Path(tmp_dir) / 'queue.db'))
+            tasks = _add_comment_tasks(queue_manager, 3)
+            client = StubLLMClient(_respond_per_task(batch_response))
+            processor = _make_processor(queue_manager, client)
+
+            results = processor.process_tasks_batch(tasks)
+
+            # The failed batch request, then one request per task
+            assert len(client.prompts) == 4
+            assert [(r.task_id, r.success, r.suggestion, r.tokens_used) for r in results] == [
+                (task.id, True, f'Single {index}', 5) for index, task in enumerate(tasks)
+            ]
+            for index, task in enumerate(tasks):
+                stored = queue_manager.get_task(task.id)
+                assert stored.status == TaskStatus.COMPLETED.value
+                assert stored.suggestion == f'Single {index}'
+
+    print("\n[PASS] Unusable batch responses retried task by task")
+
+
+def test_process_batches_concurrently_yields_every_batch():
+    """Test that every batch is processed once and paired with its own results."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        queue_manager = QueueManager(str(Path(tmp_dir) / 'queue.db'))
+        tasks = _add_comment_tasks(queue_manager, 5)
+        client = StubLLMClient(_respond_per_task('unused'))
+        processor = _make_processor(queue_manager, client)
+        processor.config.llm.max_concurrency = 3
+
+        batches = processor.make_batches(tasks, 1)
+        seen = []
+        for batch, results in processor.process_batches_concurrently(batches):
+            assert [r.task_id for r in results] == [task.id for task in batch]
+            assert results[0].suggestion == f'Single {tasks.index(batch[0])}'
+            seen.extend(task.id for task in batch)
+
+        assert sorted(seen) == [task.id for task in tasks]
+        assert len(client.prompts) == 5
+        assert list(processor.process_batches_concurrently([])) == []
+
+
+class StubBatchClient(StubLLMClient):
+    """StubLLMClient with an offline batch API returning batch_result."""
+
+    supports_batch = True
+
+    def __init__(self, respond):
+        super().__init__(respond)
+        self.submitted = []
+        self.batch_result = ('in_progress', None)
+
+    def submit_batch(self, requests):
+        self.submitted.extend(requests)
+        return 'batch_1'
+
+    def retrieve_batch(self, batch_id):
+        return self.batch_result
+
+
+def test_collect_batch_job_stores_results():
+    """Test that a finished batch job completes answered tasks and fails missing ones."""
+    print("\n" + "=" * 70)
+    print("TEST: Processor.submit_batch_job / collect_batch_job")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        queue_manager = QueueManager(str(Path(tmp_dir) / 'queue.db'))
+        tasks = _add_comment_tasks(queue_manager, 2)
+        client = StubBatchClient(_respond_per_task('unused'))
+        processor = _make_processor(queue_manager, client)
+
+        assert processor.submit_batch_job(tasks) == 'batch_1'
+        assert [request[0] for request in client.submitted] == [str(task.id) for task in tasks]
+        for task in tasks:
+            stored = queue_manager.get_task(task.id)
+            assert (stored.status, stored.batch_id) == (TaskStatus.PROCESSING.value, 'batch_1')
+
+        # Still running: nothing stored
+        assert processor.collect_batch_job('batch_1') is None
+        assert queue_manager.get_open_batch_ids() == ['batch_1']
+
+        client.batch_result = ('ended', {str(tasks[0].id): ('{"comment": "From job"}', 7)})
+        results = processor.collect_batch_job('batch_1')
+
+        assert [(r.task_id, r.success, r.suggestion, r.tokens_used) for r in results] == [
+            (tasks[0].id, True, 'From job', 7),
+            (tasks[1].id, False, None, 0),
+        ]
+        assert queue_manager.get_task(tasks[0].id).suggestion == 'From job'
+        failed = queue_manager.get_task(tasks[1].id)
+        assert failed.status == TaskStatus.FAILED.value
+        assert 'No result in batch job batch_1' in failed.error_message
+        assert queue_manager.get_open_batch_ids() == []
+
+    print("\n[PASS] Batch job results stored per task")
+
+
+def test_process_queue_claims_and_releases():
+    """Test that process_queue claims each wave and releases unfinished tasks."""
+    print("\n" + "=" * 70)
+    print("TEST: Processor.process_queue claim/release")
+    print("=" * 70)
+
+    def respond(prompt):
+        if 'COMMENT_CODE' in prompt:
+            raise _Interrupted()
+        return MODULE_RESPONSE, 10
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        queue_manager = QueueManager(str(Path(tmp_dir) / 'queue.db'))
+        module_ids = [
+            queue_manager.add_task(DocTask(file_path=f'mod_{i}.py', line_number=1,
+                                           task_type='generate_module', context='MODULE_CODE'))
+            for i in range(2)
+        ]
+        comment_id = queue_manager.add_task(DocTask(
+            file_path='mod_0.py', line_number=5, task_type='generate_comment', context='COMMENT_CODE'
+        ))
+        processor = _make_processor(queue_manager, StubLLMClient(respond))
+
+        # Interrupted in the comment wave: finished tasks keep their outcome,
+        # the claimed comment task goes back to PENDING
+        try:
+            processor.process_queue()
+            raise AssertionError("interruption was swallowed")
+        except _Interrupted:
+            pass
+
+        for task_id in module_ids:
+            task = queue_manager.get_task(task_id)
+            assert task.status == TaskStatus.COMPLETED.value
+            assert json.loads(task.suggestion)['summary'] == 'Do things.'
+        assert queue_manager.get_task(comment_id).status == TaskStatus.PENDING.value
+
+        # Claimed tasks are invisible to other runs until released
+        assert [t.id for t in queue_manager.claim_pending_tasks()] == [comment_id]
+        assert queue_manager.claim_pending_tasks() == []
+        queue_manager.release_tasks([comment_id])
+
+        processor.llm_client.respond = lambda prompt: ('{"comment": "Add one"}', 4)
+        results = processor.process_queue()
+        assert [(r.task_id, r.success, r.tokens_used) for r in results] == [(comment_id, True, 4)]
+        assert queue_manager.get_task(comment_id).status == TaskStatus.COMPLETED.value
+
+    print("\n[PASS] Waves claimed atomically, unfinished tasks released")
+
+
+if __name__ == "__main__":
+    test_split_template_keeps_prompt()
+    test_make_batches_groups_by_type()
+    test_strip_code_fence()
+    test_load_templates_cached()
+    test_parse_and_format_response_dispatch()
+    test_process_tasks_batch_maps_results()
+    test_process_tasks_batch_falls_back()
+    test_process_batches_concurrently_yields_every_batch()
+    test_collect_batch_job_stores_results()
+    test_process_queue_claims_and_releases()
@@ -0,0 +1,249 @@
+"""Test QueueManager batch job bookkeeping."""
+
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+from llm_doc_manager.src.queue import DocTask, QueueManager, TaskStatus
+
+
+def _add_tasks(queue_manager: QueueManager, count: int):
+    return [
+        queue_manager.add_task(DocTask(
+            file_path='sample.py',
+            line_number=i + 1,
+            task_type='generate_docstring'
+        ))
+        for i in range(count)
+    ]
+
+
+def test_batch_id_roundtrip():
+    """Test that submitted tasks are tracked by batch job ID."""
+    print("=" * 70)
+    print("TEST: batch_id bookkeeping")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        queue_manager = QueueManager(str(Path(tmp_dir) / 'queue.db'))
+        task_ids = _add_tasks(queue_manager, 3)
+
+        queue_manager.set_batch_id(task_ids[:2], 'batch_abc', TaskStatus.PROCESSING)
+
+        batch_tasks = queue_manager.get_tasks_by_batch('batch_abc')
+        assert [task.id for task in batch_tasks] == task_ids[:2]
+        assert all(task.batch_id == 'batch_abc' for task in batch_tasks)
+        assert all(task.status == TaskStatus.PROCESSING.value for task in batch_tasks)
+        assert queue_manager.get_task(task_ids[2]).status == TaskStatus.PENDING.value
+        assert queue_manager.get_open_batch_ids() == ['batch_abc']
+
+        # Once every task has its result the job is no longer open
+        for task_id in task_ids[:2]:
+            queue_manager.update_task_status(task_id, TaskStatus.COMPLETED)
+        assert queue_manager.get_open_batch_ids() == []
+
+    print("\n[PASS] Batch jobs tracked per task")
+
+
+def test_batch_id_column_migration():
+    """Test that databases created before batch_id gain the column."""
+    print("\n" + "=" * 70)
+    print("TEST: batch_id migration")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'queue.db'
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE documentation_tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_path TEXT NOT NULL,
+                line_number INTEGER NOT NULL,
+                task_type TEXT NOT NULL,
+                marker_text TEXT,
+                context TEXT,
+                status TEXT DEFAULT 'pending',
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                error_message TEXT,
+                suggestion TEXT,
+                accepted INTEGER DEFAULT 0,
+                scope_name TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+        queue_manager = QueueManager(str(db_path))
+        task_id = _add_tasks(queue_manager, 1)[0]
+
+        assert queue_manager.get_task(task_id).batch_id is None
+
+    print("\n[PASS] Legacy database migrated")
+
+
+def test_save_results_bulk_update():
+    """Test that several task outcomes are stored in one call."""
+    print("\n" + "=" * 70)
+    print("TEST: save_results")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        queue_manager = QueueManager(str(Path(tmp_dir) / 'queue.db'))
+        done_id, failed_id = _add_tasks(queue_manager, 2)
+        queue_manager.update_suggestion(failed_id, 'previous suggestion')
+
+        queue_manager.save_results([
+            (done_id, TaskStatus.COMPLETED, '{"summary": "Doc."}', None),
+            (failed_id, TaskStatus.FAILED, None, 'API error'),
+        ])
+
+        done = queue_manager.get_task(done_id)
+        failed = queue_manager.get_task(failed_id)
+        assert done.status == TaskStatus.COMPLETED.value
+        assert done.suggestion == '{"summary": "Doc."}'
+        assert done.error_message is None
+        assert failed.status == TaskStatus.FAILED.value
+        assert failed.error_message == 'API error'
+        assert failed.suggestion == 'previous suggestion'
+
+        queue_manager.save_results([])  # No-op
+
+    print("\n[PASS] Task outcomes stored in bulk")
+
+
+def test_shared_connection_across_threads():
+    """Test that worker threads can share one QueueManager connection."""
+    print("\n" + "=" * 70)
+    print("TEST: shared connection")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'queue.db'
+        queue_manager = QueueManager(str(db_path))
+        task_ids = _add_tasks(queue_manager, 20)
+
+        def worker(task_id):
+            queue_manager.save_results([(task_id, TaskStatus.COMPLETED, 'Doc.', None)])
+
+        threads = [threading.Thread(target=worker, args=(task_id,)) for task_id in task_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert queue_manager.get_stats() == {TaskStatus.COMPLETED.value: 20, 'total': 20}
+
+        # Failed statements are rolled back and the connection stays usable
+        try:
+            with queue_manager._connect() as conn:
+                conn.execute("DELETE FROM documentation_tasks")
+                conn.execute("SELECT * FROM missing_table")
+        except sqlite3.OperationalError:
+            pass
+        assert queue_manager.get_stats()['total'] == 20
+
+        queue_manager.close()
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    print("\n[PASS] Concurrent writes through one connection")
+
+
+def test_add_tasks_bulk_insert():
+    """Test that add_tasks inserts every task in one call."""
+    print("\n" + "=" * 70)
+    print("TEST: add_tasks")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        queue_manager = QueueManager(str(Path(tmp_dir) / 'queue.db'))
+        tasks = [
+            DocTask(file_path='sample.py', line_number=i + 1, task_type='generate_docstring',
+                    scope_name=f'func_{i}')
+            for i in range(5)
+        ]
+
+        assert queue_manager.add_tasks(tasks) == 5
+        assert queue_manager.add_tasks([]) == 0
+
+        pending = queue_manager.get_pending_tasks()
+        assert sorted(task.scope_name for task in pending) == [f'func_{i}' for i in range(5)]
+        assert all(task.status == TaskStatus.PENDING.value for task in pending)
+        assert all(task.created_at for task in pending)
+        assert DocTask.from_dict(pending[0].to_dict()) == pending[0]
+        assert pending[0].to_row('now')[-2:] == ('now', 'now')
+
+    print("\n[PASS] Tasks inserted in bulk")
+
+
+def test_claim_pending_tasks():
+    """Test that claims are exclusive and unfinished claims can be released."""
+    print("\n" + "=" * 70)
+    print("TEST: claim_pending_tasks / release_tasks")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir) / 'queue.db')
+        queue_manager = QueueManager(db_path)
+        task_ids = _add_tasks(queue_manager, 4)
+        queue_manager.add_task(DocTask(file_path='sample.py', task_type='generate_class'))
+
+        first = queue_manager.claim_pending_tasks('generate_docstring', 3)
+        assert [task.id for task in first] == task_ids[:3]
+        assert all(task.status == TaskStatus.PROCESSING.value for task in first)
+
+        # A second manager (e.g. another process) only sees the rest
+        other = QueueManager(db_path)
+        second = other.claim_pending_tasks('generate_docstring')
+        assert [task.id for task in second] == task_ids[3:]
+        assert other.claim_pending_tasks('generate_docstring') == []
+        other.close()
+
+        queue_manager.update_task_status(task_ids[0], TaskStatus.COMPLETED)
+        queue_manager.release_tasks(task_ids)
+
+        assert queue_manager.get_task(task_ids[0]).status == TaskStatus.COMPLETED.value
+        assert [task.id for task in queue_manager.get_pending_tasks()][:3] == task_ids[1:]
+        assert len(queue_manager.claim_pending_tasks()) == 4
+
+    print("\n[PASS] Pending tasks claimed exactly once")
+
+
+def test_ordered_queries_use_indexes():
+    """Test that FIFO and apply-order queries need no in-memory sort."""
+    print("\n" + "=" * 70)
+    print("TEST: ordering indexes")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'queue.db'
+        QueueManager(str(db_path))
+
+        queries = [
+            ("SELECT * FROM documentation_tasks WHERE status = ? ORDER BY created_at ASC", ('pending',)),
+            ("SELECT * FROM documentation_tasks WHERE accepted = 1 "
+             "ORDER BY file_path ASC, line_number DESC", ()),
+        ]
+        with sqlite3.connect(db_path) as conn:
+            for query, params in queries:
+                plan = ' '.join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+                print(plan)
+                assert 'USING INDEX' in plan and 'TEMP B-TREE' not in plan
+
+    print("\n[PASS] Ordered queries walk an index")
+
+
+if __name__ == "__main__":
+    test_batch_id_roundtrip()
+    test_batch_id_column_migration()
+    test_save_results_bulk_update()
+    test_shared_connection_across_threads()
+    test_add_tasks_bulk_insert()
+    test_claim_pending_tasks()
+    test_ordered_queries_use_indexes()
+
+    print("\n" + "=" * 70)
+    print("ALL QUEUE TESTS PASSED!")
+    print("=" * 70)
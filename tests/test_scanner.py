@@ -0,0 +1,198 @@
+"""Test Scanner file collection."""
+
+import tempfile
+from pathlib import Path
+
+from llm_doc_manager.src import scanner as scanner_module
+from llm_doc_manager.src.config import Config
+from llm_doc_manager.src.scanner import Scanner
+
+
+MARKED_SOURCE = '''# @llm-doc-start
+def sample_{index}(a):
+    return a
+# @llm-doc-end
+'''
+
+
+def test_collect_files_applies_excludes():
+    """Test glob and substring excludes for directories and files."""
+    print("=" * 70)
+    print("TEST: Scanner._collect_files")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        for relative in ('main.py', 'notes.txt', 'pkg/mod.py', 'pkg/mod_test.py',
+                         'venv/lib.py', 'build_output/gen.py', 'pkg/sub/deep.py'):
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x = 1\n", encoding='utf-8')
+
+        config = Config()
+        config.scanning.exclude = ['venv', '*_test.py', 'build_']
+        files = Scanner(config)._collect_files([tmp_dir])
+
+        names = sorted(str(f.relative_to(root)) for f in files)
+        print(names)
+        assert names == ['main.py', 'pkg/mod.py', 'pkg/sub/deep.py']
+
+        # Explicit file paths go through the same filters
+        assert Scanner(config)._collect_files([str(root / 'pkg/mod_test.py')]) == []
+
+    print("\n[PASS] Excluded paths skipped")
+
+
+def test_collect_files_skips_oversized():
+    """Test that files above max_file_size_mb are skipped during the walk."""
+    print("\n" + "=" * 70)
+    print("TEST: Scanner._collect_files size limit")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        (root / 'small.py').write_text("x = 1\n", encoding='utf-8')
+        (root / 'large.py').write_text("x = 1\n" * 50000, encoding='utf-8')
+
+        config = Config()
+        config.scanning.max_file_size_mb = 0.1
+        files = Scanner(config)._collect_files([tmp_dir])
+
+        assert [f.name for f in files] == ['small.py']
+
+    print("\n[PASS] Oversized file skipped")
+
+
+def test_scan_file_content_reads_bytes():
+    """Test the marker-free shortcut and newline handling of the byte read."""
+    print("\n" + "=" * 70)
+    print("TEST: Scanner.scan_file_content")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        plain = Path(tmp_dir) / 'plain.py'
+        plain.write_bytes(b"x = 1\r\n")
+        crlf = Path(tmp_dir) / 'crlf.py'
+        crlf.write_bytes(MARKED_SOURCE.format(index=0).replace('\n', '\r\n').encode('utf-8'))
+
+        scanner = Scanner(Config())
+        assert scanner.scan_file_content(str(plain)) == (str(plain), [], [], None)
+
+        _, issues, blocks, error = scanner.scan_file_content(str(crlf))
+        assert error is None and issues == []
+        assert [b.full_code for b in blocks] == ["def sample_0(a):\n    return a"]
+
+    print("\n[PASS] Marker-free files skipped, CRLF normalized like text mode")
+
+
+def test_read_if_marked_chunks():
+    """Test chunked marker search, including markers across chunk edges."""
+    print("\n" + "=" * 70)
+    print("TEST: Scanner._read_if_marked")
+    print("=" * 70)
+
+    original_chunk = scanner_module.READ_CHUNK_BYTES
+    scanner_module.READ_CHUNK_BYTES = 16
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'sample.py'
+            for offset in range(40):
+                data = b'x' * offset + b'# @llm-doc-start\n' + b'y' * 30
+                path.write_bytes(data)
+                assert Scanner._read_if_marked(str(path)) == data
+
+            path.write_bytes(b'# @llm' + b'z' * 100)
+            assert Scanner._read_if_marked(str(path)) is None
+            path.write_bytes(b'')
+            assert Scanner._read_if_marked(str(path)) is None
+    finally:
+        scanner_module.READ_CHUNK_BYTES = original_chunk
+
+    print("\n[PASS] Markers found wherever they fall")
+
+
+def test_parallel_scan_matches_serial():
+    """Test that the process pool returns the same result as a serial scan."""
+    print("\n" + "=" * 70)
+    print("TEST: parallel Scanner.scan")
+    print("=" * 70)
+
+    original_threshold = scanner_module.PARALLEL_SCAN_MIN_FILES
+    scanner_module.PARALLEL_SCAN_MIN_FILES = 0
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for index in range(12):
+                (Path(tmp_dir) / f'mod_{index}.py').write_text(
+                    MARKED_SOURCE.format(index=index), encoding='utf-8'
+                )
+            # Unbalanced markers produce a validation error for this file
+            (Path(tmp_dir) / 'broken.py').write_text("# @llm-doc-start\nx = 1\n", encoding='utf-8')
+
+            results = []
+            for parallel in (False, True):
+                config = Config()
+                config.scanning.parallel = parallel
+                config.scanning.workers = 2
+                results.append(Scanner(config).scan([tmp_dir]))
+
+            serial, parallel = results
+            assert serial.files_scanned == parallel.files_scanned == 13
+            assert serial.blocks_found == parallel.blocks_found == 12
+            assert list(serial.file_blocks) == list(parallel.file_blocks)
+            assert [str(i) for i in serial.validation_issues] == \
+                [str(i) for i in parallel.validation_issues]
+    finally:
+        scanner_module.PARALLEL_SCAN_MIN_FILES = original_threshold
+
+    print("\n[PASS] Parallel scan matches serial scan")
+
+
+def test_scan_worker_uses_caller_config():
+    """Test that pool workers scan with the config handed to the initializer."""
+    config = Config()
+    config.scanning.exclude = ['generated']
+
+    scanner_module._init_scan_worker(config)
+    try:
+        assert scanner_module._worker_scanner.config is config
+    finally:
+        scanner_module._worker_scanner = None
+
+
+def test_scan_file_skips_collection():
+    """Test that scan_file matches scan() for one file without collecting."""
+    print("\n" + "=" * 70)
+    print("TEST: Scanner.scan_file")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        marked = Path(tmp_dir) / 'marked.py'
+        marked.write_text(MARKED_SOURCE.format(index=0), encoding='utf-8')
+        broken = Path(tmp_dir) / 'broken.py'
+        broken.write_text("# @llm-doc-start\nx = 1\n", encoding='utf-8')
+
+        scanner = Scanner(Config())
+        scanner._collect_files = None  # scan_file must not walk or filter
+
+        result = scanner.scan_file(str(marked))
+        assert result.files_scanned == 1 and result.blocks_found == 1
+        assert list(result.file_blocks) == [str(marked)]
+
+        result = scanner.scan_file(str(broken))
+        assert result.files_scanned == 1 and result.file_blocks == {}
+        assert result.validation_issues
+
+        result = scanner.scan_file(str(Path(tmp_dir) / 'missing.py'))
+        assert result.files_scanned == 0 and len(result.errors) == 1
+
+    print("\n[PASS] Single file scanned directly")
+
+
+if __name__ == "__main__":
+    test_collect_files_applies_excludes()
+    test_collect_files_skips_oversized()
+    test_scan_file_content_reads_bytes()
+    test_read_if_marked_chunks()
+    test_parallel_scan_matches_serial()
+    test_scan_worker_uses_caller_config()
+    test_scan_file_skips_collection()
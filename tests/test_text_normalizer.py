@@ -0,0 +1,78 @@
+"""Test Google Style docstring formatting and normalization in text_normalizer."""
+
+from llm_doc_manager.utils.text_normalizer import (
+    format_google_style_docstring,
+    wrap_and_normalize
+)
+
+
+def test_google_style_section_indentation():
+    """Test that section headers and their content get the right indent."""
+    print("=" * 70)
+    print("TEST: format_google_style_docstring sections")
+    print("=" * 70)
+
+    raw = '''"""
+        Compute the total.
+
+        Uses: the cached price list.
+
+        Args:
+        price (float): Base price
+            discount (float): Discount rate
+        See Also: other helpers
+        Returns:
+        float: Final price
+        """'''
+
+    result = format_google_style_docstring(raw, "    ")
+    print(result)
+
+    assert result.split('\n') == [
+        '    """',
+        '    Compute the total.',
+        '',
+        '    Uses: the cached price list.',
+        '',
+        '    Args:',
+        '        price (float): Base price',
+        '        discount (float): Discount rate',
+        '    See Also: other helpers',
+        '    Returns:',
+        '        float: Final price',
+        '    """',
+    ]
+
+    print("\n[PASS] Sections formatted with deterministic indentation")
+
+
+def test_google_style_header_requires_colon():
+    """Test that a bare section word without colon is not a header."""
+    result = format_google_style_docstring("Summary.\nArgs\nNotes: x", "")
+
+    assert result.split('\n') == ['"""', 'Summary.', 'Args', 'Notes: x', '"""']
+
+
+def test_google_style_keeps_inner_quotes():
+    """Test that only the surrounding triple quotes are removed."""
+    result = format_google_style_docstring('"""Return "ok" or \'no\'"""', "")
+    assert result.split('\n') == ['"""', 'Return "ok" or \'no\'', '"""']
+
+    result = format_google_style_docstring("'''Use the \"name\"'''", "")
+    assert result.split('\n') == ['"""', 'Use the "name"', '"""']
+
+
+def test_wrap_and_normalize_dedents():
+    """Test that common indentation is removed and blank lines kept as-is."""
+    text = "    Summary.\n  \n        Indented detail.\n    End."
+
+    assert wrap_and_normalize(text) == "Summary.\n  \n    Indented detail.\nEnd."
+    assert wrap_and_normalize("No indent\n  Some") == "No indent\n  Some"
+    assert wrap_and_normalize("   \n  ") == "   \n  "
+
+
+if __name__ == "__main__":
+    test_google_style_section_indentation()
+    test_google_style_header_requires_colon()
+    test_google_style_keeps_inner_quotes()
+    test_wrap_and_normalize_dedents()